@@ -12,6 +12,10 @@ Usage:
     python example_usage.py
 """
 
+import re
+from collections import defaultdict
+from functools import lru_cache
+
 from pseudonymscript import pseudonymize_text
 
 # Sample legal document text
@@ -22,6 +26,31 @@ Paragraph 2:
 On 20 October 2021, the parties executed a Settlement Agreement. Anna Lee, in her capacity as Director of Orion Holdings Ltd, agreed to resolve the dispute with Carlos Rivera ("Defendant") on terms providing for payment of EUR 300,000. The Settlement was witnessed by Attorney Jason Tan and signed at One Raffles Quay, Singapore."""
 
 
+_MONTHS = (r"January|February|March|April|May|June|July|August"
+           r"|September|October|November|December")
+_MONTHS_RE = re.compile(_MONTHS)
+
+# Categories are tried in order; the first alternative that matches wins
+_CATEGORY_RE = re.compile(
+    r"(?P<legal>.*?(?:Plaintiff|Defendant|Attorney|Director|Partner))"
+    r"|(?P<org>ORG|Bank)"
+    r"|(?P<location>Country|City|State|Building)"
+    r"|(?P<address>\[ADDRESS)"
+    r"|(?P<money>.*?(?:USD|EUR|GBP|SGD))"
+    rf"|(?P<date>.*?(?:{_MONTHS}))",
+    re.DOTALL
+)
+
+_CATEGORY_NAMES = {
+    "legal": "Legal Persons",
+    "org": "Organizations",
+    "location": "Locations",
+    "address": "Addresses",
+    "money": "Money",
+    "date": "Dates"
+}
+
+
 def print_header(title):
     """Print a formatted section header"""
     print("\n" + "=" * 80)
@@ -29,6 +58,13 @@ def print_header(title):
     print("=" * 80)
 
 
+@lru_cache(maxsize=4096)
+def categorize_replacement(replacement):
+    """Return the display category for a single pseudonymized replacement"""
+    match = _CATEGORY_RE.match(replacement)
+    return _CATEGORY_NAMES[match.lastgroup] if match else "Other"
+
+
 def categorize_entities(mapping):
     """Categorize entities by type for organized display"""
     categories = {
@@ -42,33 +78,33 @@ def categorize_entities(mapping):
     }
     
     for original, replacement in mapping.items():
-        if any(role in replacement for role in ["Plaintiff", "Defendant", "Attorney", "Director", "Partner"]):
-            categories["Legal Persons"].append((original, replacement))
-        elif replacement.startswith("ORG") or replacement.startswith("Bank"):
-            categories["Organizations"].append((original, replacement))
-        elif replacement.startswith(("Country", "City", "State", "Building")):
-            categories["Locations"].append((original, replacement))
-        elif replacement.startswith("[ADDRESS"):
-            categories["Addresses"].append((original, replacement))
-        elif any(currency in replacement for currency in ["USD", "EUR", "GBP", "SGD"]):
-            categories["Money"].append((original, replacement))
-        elif any(month in replacement for month in 
-                ["January", "February", "March", "April", "May", "June", 
-                 "July", "August", "September", "October", "November", "December"]):
-            categories["Dates"].append((original, replacement))
-        else:
-            categories["Other"].append((original, replacement))
+        categories[categorize_replacement(replacement)].append((original, replacement))
     
     return categories
 
 
-def check_consistency(mapping, name):
+def group_by_name(mapping, names):
+    """Bucket mapping entries and their distinct replacements by each name found in the original text"""
+    buckets = defaultdict(lambda: ([], set()))
+    
+    for original, replacement in mapping.items():
+        # Every name is tested on its own, so one name inside another (e.g. "Lee" in "Anna Lee")
+        # still collects the entry
+        for name in names:
+            if name in original:
+                items, replacements = buckets[name]
+                items.append((original, replacement))
+                replacements.add(replacement)
+    
+    return buckets
+
+
+def check_consistency(bucket):
     """Check if all occurrences of a name are pseudonymized consistently"""
-    items = [(k, v) for k, v in mapping.items() if name in k]
-    if not items:
+    if not bucket:
         return None
     
-    unique_replacements = set(v for k, v in items)
+    items, unique_replacements = bucket
     return len(unique_replacements) == 1, unique_replacements, items
 
 
@@ -99,48 +135,29 @@ def main():
     
     print_header("CONSISTENCY VERIFICATION")
     
-    # Check Anna Lee consistency
-    print("\n  Checking 'Anna Lee' cross-references:")
-    result = check_consistency(entity_mapping, "Anna Lee")
-    if result:
-        is_consistent, replacements, items = result
-        for orig, repl in items:
-            print(f"    • '{orig}' → '{repl}'")
-        if is_consistent:
-            print(f"    ✅ Consistent! All references → {list(replacements)[0]}")
-        else:
-            print(f"    ⚠️  Inconsistent: {replacements}")
-    
-    # Check Carlos Rivera consistency
-    print("\n  Checking 'Carlos Rivera' cross-references:")
-    result = check_consistency(entity_mapping, "Carlos Rivera")
-    if result:
-        is_consistent, replacements, items = result
-        for orig, repl in items:
-            print(f"    • '{orig}' → '{repl}'")
-        if is_consistent:
-            print(f"    ✅ Consistent! All references → {list(replacements)[0]}")
-        else:
-            print(f"    ⚠️  Inconsistent: {replacements}")
-    
-    # Check Orion Holdings consistency
-    print("\n  Checking 'Orion Holdings Ltd' cross-references:")
-    result = check_consistency(entity_mapping, "Orion Holdings")
-    if result:
-        is_consistent, replacements, items = result
-        for orig, repl in items:
-            print(f"    • '{orig}' → '{repl}'")
-        if is_consistent:
-            print(f"    ✅ Consistent! All references → {list(replacements)[0]}")
-        else:
-            print(f"    ⚠️  Inconsistent: {replacements}")
+    # Names to verify, with the label shown for each
+    consistency_checks = {
+        "Anna Lee": "Anna Lee",
+        "Carlos Rivera": "Carlos Rivera",
+        "Orion Holdings": "Orion Holdings Ltd"
+    }
+    buckets = group_by_name(entity_mapping, consistency_checks)
+    
+    for name, label in consistency_checks.items():
+        print(f"\n  Checking '{label}' cross-references:")
+        result = check_consistency(buckets.get(name))
+        if result:
+            is_consistent, replacements, items = result
+            for orig, repl in items:
+                print(f"    • '{orig}' → '{repl}'")
+            if is_consistent:
+                print(f"    ✅ Consistent! All references → {list(replacements)[0]}")
+            else:
+                print(f"    ⚠️  Inconsistent: {replacements}")
     
     print_header("DATE INTERVAL PRESERVATION CHECK")
     
-    dates = [(k, v) for k, v in entity_mapping.items() if any(
-        month in v for month in ["January", "February", "March", "April", 
-                                 "May", "June", "July", "August", 
-                                 "September", "October", "November", "December"])]
+    dates = [(k, v) for k, v in entity_mapping.items() if _MONTHS_RE.search(v)]
     
     print("\n  Original dates:")
     print("    • 3 May 2021")
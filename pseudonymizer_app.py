@@ -2,89 +2,175 @@
 """Streamlit app for legal document pseudonymization."""
 import streamlit as st
 import pandas as pd
+import numpy as np
+import re
 from pathlib import Path
 import time
 from io import BytesIO
+from itertools import chain
+from dataclasses import asdict
+from functools import lru_cache
+from xml.sax.saxutils import escape
 
-import docx
-import PyPDF2
-import pdfplumber
-from docx import Document
-
-from reportlab.lib.pagesizes import letter
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.units import inch
-
-from pseudonymscript import PseudonymizationPipeline, PseudonymConfig, pseudonymize_text
+# Document, PDF and NLP libraries are imported where they are used so that
+# app start-up does not pay for spaCy, reportlab or the PDF parsers until needed
 
 st.set_page_config(
     page_title="Document Pseudonymizer",
     page_icon="🔒",
     layout="wide"
 )
+
+# PDF extraction tries PyPDF2 first and escalates to pdfplumber only when
+# PyPDF2 fails or yields less text than this many characters per page
+PDF_MIN_CHARS_PER_PAGE = 20
+
+# Mapping entries are rendered as <br/>-separated lines in batches of this size,
+# which keeps the reportlab flowable count low for large mappings. Much larger batches
+# are slower: a paragraph that spans pages is re-wrapped on every split (one paragraph
+# for 5000 entries takes ~80s against ~2s here).
+MAPPING_PDF_ENTRIES_PER_PARAGRAPH = 20
+
+# spaCy model per speed/accuracy tier, fastest first
+MODEL_TIERS = {
+    "Fast (en_core_web_sm)": "en_core_web_sm",
+    "Balanced (en_core_web_lg)": "en_core_web_lg",
+    "Accurate (en_core_web_trf)": "en_core_web_trf"
+}
+
+# WordprocessingML tags in Clark notation, for walking DOCX XML without python-docx wrappers
+W_NS = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+DOCX_PARAGRAPH_TAG = W_NS + "p"
+DOCX_TEXT_TAG = W_NS + "t"
+# Tabs and line breaks are separate run elements. As in python-docx's .text, only
+# text-wrapping breaks become newlines; page and column breaks are dropped by the XPath below
+DOCX_RUN_TEXT = {W_NS + "tab": "\t", W_NS + "br": "\n", W_NS + "cr": "\n"}
+# Text boxes saved with a VML fallback are stored twice; the mc:Fallback copy is skipped
+DOCX_FALLBACK_TAG = "{http://schemas.openxmlformats.org/markup-compatibility/2006}Fallback"
+
+# Curly quotes are normalized to ASCII so the extractors' patterns match them
+QUOTE_TABLE = str.maketrans({'\u201c': '"', '\u201d': '"', '\u2018': "'", '\u2019': "'"})
+
+# Rows of the entity mapping sent to the browser per page
+MAPPING_PAGE_SIZE = 500
+
+# Pseudonymization results hold the original text and mapping and are shared across
+# sessions, so only a few are kept, and none for longer than this many seconds
+PSEUDONYMIZE_CACHE_ENTRIES = 8
+PSEUDONYMIZE_CACHE_TTL = 15 * 60
+
+# Generated PDFs kept per export function; the mapping PDF lists every original, so older
+# PDFs are evicted and all expire after PSEUDONYMIZE_CACHE_TTL like the results above
+PDF_CACHE_ENTRIES = 4
+
+# Characters shown in the comparison text areas; the full text is only served via downloads
+PREVIEW_CHARS = 20_000
+
+
+@lru_cache(maxsize=None)
+def docx_run_content_xpath():
+    from lxml import etree
+    
+    # Text, tab and line-break elements of a paragraph's own runs, including hyperlinked runs;
+    # a text box anchored in the paragraph is left to be read as its own paragraphs
+    return etree.XPath(
+        "(w:r | w:hyperlink/w:r)/*[self::w:t or self::w:tab or self::w:cr"
+        " or self::w:br[not(@w:type) or @w:type = 'textWrapping']]",
+        namespaces={"w": W_NS[1:-1]}
+    )
+
  
 class DocumentProcessor:
     
     @staticmethod
     def extract_text_from_txt(file) -> str:
-        try:
-            text = file.read().decode('utf-8')
-        except UnicodeDecodeError:
-            file.seek(0)
-            for encoding in ['utf-8', 'latin-1', 'cp1252']:
-                try:
-                    file.seek(0)
-                    text = file.read().decode(encoding)
-                    break
-                except UnicodeDecodeError:
-                    continue
-            else:
-                raise ValueError("Could not decode text file")
+        raw = file.getvalue()
+        
+        for encoding in ('utf-8', 'cp1252', 'latin-1'):
+            try:
+                text = raw.decode(encoding)
+                break
+            except UnicodeDecodeError:
+                continue
+        else:
+            raise ValueError("Could not decode text file")
         
-        text = text.replace('\u201c', '"').replace('\u201d', '"')
-        text = text.replace('\u2018', "'").replace('\u2019', "'")
+        text = text.translate(QUOTE_TABLE)
         
         return text
     
     @staticmethod
     def extract_text_from_docx(file) -> str:
-        doc = Document(file)
-        full_text = []
+        from docx import Document
         
-        for paragraph in doc.paragraphs:
-            full_text.append(paragraph.text)
-        
-        for table in doc.tables:
-            for row in table.rows:
-                for cell in row.cells:
-                    full_text.append(cell.text)
-        
-        text = '\n'.join(full_text)
-        text = text.replace('\u201c', '"').replace('\u201d', '"')
-        text = text.replace('\u2018', "'").replace('\u2019', "'")
+        doc = Document(file)
+        run_content = docx_run_content_xpath()
+        
+        # One pass over the body XML picks up table-cell and text-box paragraphs in document
+        # order without building python-docx Paragraph/Table/Cell wrappers
+        text = '\n'.join(
+            ''.join((node.text or '') if node.tag == DOCX_TEXT_TAG else DOCX_RUN_TEXT[node.tag]
+                    for node in run_content(paragraph))
+            for paragraph in doc.element.body.iter(DOCX_PARAGRAPH_TAG)
+            if next(paragraph.iterancestors(DOCX_FALLBACK_TAG), None) is None
+        )
+        text = text.translate(QUOTE_TABLE)
         
         return text
     
     @staticmethod
-    def extract_text_from_pdf(file) -> str:
-        text_content = []
-        
+    def _extract_pdfplumber_page(page) -> str:
+        # Plain (non-layout) extraction, then drop the page's parsed objects so long
+        # PDFs don't keep every page's characters in memory
         try:
-            with pdfplumber.open(file) as pdf:
-                for page in pdf.pages:
-                    text = page.extract_text()
-                    if text:
-                        text_content.append(text)
-        except Exception:
-            file.seek(0)
-            pdf_reader = PyPDF2.PdfReader(file)
-            for page in pdf_reader.pages:
-                text_content.append(page.extract_text())
-        
-        text = '\n'.join(text_content)
-        text = text.replace('\u201c', '"').replace('\u201d', '"')
-        text = text.replace('\u2018', "'").replace('\u2019', "'")
+            return page.extract_text(x_tolerance=3, y_tolerance=3, layout=False)
+        finally:
+            page.close()
+    
+    @staticmethod
+    def _extract_pdf_with_pymupdf(data: bytes) -> tuple[str, int]:
+        import pymupdf
+        
+        # Pages are read serially from one document: PyMuPDF is not thread-safe and
+        # holds the GIL, so worker threads only add the cost of reopening the file
+        with pymupdf.open(stream=data, filetype="pdf") as doc:
+            text = '\n'.join(filter(None, (page.get_text("text") for page in doc)))
+            return text, doc.page_count
+    
+    @staticmethod
+    def _extract_pdf_with_pypdf2(data: bytes) -> tuple[str, int]:
+        import PyPDF2
+        
+        # PyPDF2 is pure Python and never releases the GIL, so pages are read serially
+        pdf_reader = PyPDF2.PdfReader(BytesIO(data))
+        text = '\n'.join(filter(None, (page.extract_text() for page in pdf_reader.pages)))
+        return text, len(pdf_reader.pages)
+    
+    @classmethod
+    def extract_text_from_pdf(cls, file) -> str:
+        data = file.getvalue()
+        page_count = 0
+        text = ""
+        
+        # PyMuPDF (C-backed) is the fast path; PyPDF2 covers installs without it and files it rejects
+        for extractor in (cls._extract_pdf_with_pymupdf, cls._extract_pdf_with_pypdf2):
+            try:
+                text, page_count = extractor(data)
+                break
+            except Exception:
+                text = ""
+        
+        if len(text.strip()) < PDF_MIN_CHARS_PER_PAGE * max(page_count, 1):
+            try:
+                import pdfplumber
+                
+                with pdfplumber.open(BytesIO(data)) as pdf:
+                    text = '\n'.join(filter(None, map(cls._extract_pdfplumber_page, pdf.pages)))
+            except Exception:
+                if not text:
+                    raise
+        
+        text = text.translate(QUOTE_TABLE)
         
         return text
     
@@ -101,16 +187,12 @@ class DocumentProcessor:
         else:
             raise ValueError(f"Unsupported file type: {file_extension}")
         
-        content = content.replace('"', '"').replace('"', '"')
-        content = content.replace(''', "'").replace(''', "'")
-        
         return content, uploaded_file.name
 
 
-def create_pdf(content: str, filename: str) -> BytesIO:
-    buffer = BytesIO()
-    doc = SimpleDocTemplate(buffer, pagesize=letter, rightMargin=72, leftMargin=72,
-                           topMargin=72, bottomMargin=18)
+@lru_cache(maxsize=None)
+def get_pdf_styles() -> tuple:
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
     
     styles = getSampleStyleSheet()
     title_style = ParagraphStyle(
@@ -119,45 +201,50 @@ def create_pdf(content: str, filename: str) -> BytesIO:
         fontSize=16,
         spaceAfter=30,
     )
-    normal_style = styles['Normal']
-    normal_style.fontSize = 10
-    normal_style.leading = 12
+    normal_style = ParagraphStyle(
+        'CustomNormal',
+        parent=styles['Normal'],
+        fontSize=10,
+        leading=12,
+    )
+    
+    return title_style, normal_style
+
+
+def create_pdf(content: str, filename: str) -> bytes:
+    from reportlab.lib.pagesizes import letter
+    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
+    
+    buffer = BytesIO()
+    doc = SimpleDocTemplate(buffer, pagesize=letter, rightMargin=72, leftMargin=72,
+                           topMargin=72, bottomMargin=18)
+    
+    title_style, normal_style = get_pdf_styles()
     
     story = []
     
-    title = Paragraph(f"Pseudonymized Document: {filename}", title_style)
+    title = Paragraph(f"Pseudonymized Document: {escape(filename)}", title_style)
     story.append(title)
     story.append(Spacer(1, 12))
     
-    paragraphs = content.split('\n\n')
-    for para in paragraphs:
-        if para.strip():
-            cleaned_para = para.replace('\n', ' ').strip()
-            if cleaned_para:
-                p = Paragraph(cleaned_para, normal_style)
-                story.append(p)
-                story.append(Spacer(1, 6))
+    paragraphs = filter(None, (para.replace('\n', ' ').strip() for para in content.split('\n\n')))
+    story.extend(chain.from_iterable(
+        (Paragraph(escape(para), normal_style), Spacer(1, 6)) for para in paragraphs
+    ))
     
     doc.build(story)
-    buffer.seek(0)
-    return buffer
+    return buffer.getvalue()
 
 
-def create_mapping_pdf(mapping: dict) -> BytesIO:
+def create_mapping_pdf(mapping: dict) -> bytes:
+    from reportlab.lib.pagesizes import letter
+    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
+    
     buffer = BytesIO()
     doc = SimpleDocTemplate(buffer, pagesize=letter, rightMargin=72, leftMargin=72,
                            topMargin=72, bottomMargin=18)
     
-    styles = getSampleStyleSheet()
-    title_style = ParagraphStyle(
-        'CustomTitle',
-        parent=styles['Heading1'],
-        fontSize=16,
-        spaceAfter=30,
-    )
-    normal_style = styles['Normal']
-    normal_style.fontSize = 10
-    normal_style.leading = 12
+    title_style, normal_style = get_pdf_styles()
     
     story = []
     
@@ -165,14 +252,25 @@ def create_mapping_pdf(mapping: dict) -> BytesIO:
     story.append(title)
     story.append(Spacer(1, 12))
     
-    for original, replacement in mapping.items():
-        entry = Paragraph(f"<b>{original}</b> → {replacement}", normal_style)
-        story.append(entry)
+    entries = [f"<b>{escape(original)}</b> → {escape(replacement)}"
+               for original, replacement in mapping.items()]
+    for start in range(0, len(entries), MAPPING_PDF_ENTRIES_PER_PARAGRAPH):
+        batch = entries[start:start + MAPPING_PDF_ENTRIES_PER_PARAGRAPH]
+        story.append(Paragraph("<br/>".join(batch), normal_style))
         story.append(Spacer(1, 6))
     
     doc.build(story)
-    buffer.seek(0)
-    return buffer
+    return buffer.getvalue()
+
+
+@st.cache_data(max_entries=PDF_CACHE_ENTRIES, ttl=PSEUDONYMIZE_CACHE_TTL, show_spinner=False)
+def cached_pdf(content: str, filename: str) -> bytes:
+    return create_pdf(content, filename)
+
+
+@st.cache_data(max_entries=PDF_CACHE_ENTRIES, ttl=PSEUDONYMIZE_CACHE_TTL, show_spinner=False)
+def cached_mapping_pdf(mapping: dict) -> bytes:
+    return create_mapping_pdf(mapping)
 
 
 def init_session():
@@ -186,31 +284,118 @@ def init_session():
         st.session_state.filename = ""
     if 'processing_time' not in st.session_state:
         st.session_state.processing_time = 0.0
+    if 'last_run_id' not in st.session_state:
+        st.session_state.last_run_id = None
+    if 'mapping_df' not in st.session_state:
+        st.session_state.mapping_df = None
+
+
+def config_key(config) -> tuple:
+    return tuple(sorted(asdict(config).items()))
+
+
+@st.cache_resource(show_spinner=False)
+def resolve_model(model_name: str) -> str:
+    from pseudonymscript import resolve_spacy_model
+    
+    return resolve_spacy_model(model_name)
+
+
+# Keyed by the model that is actually installed, so a tier that falls back to another
+# model shares that model's cached instance instead of loading a second copy
+@st.cache_resource(show_spinner=False)
+def get_nlp(model_name: str, disable: tuple):
+    from pseudonymscript import load_spacy_model
+    
+    return load_spacy_model(model_name, disable)
+
+
+@st.cache_resource(show_spinner=False)
+def get_pipeline(config_items: tuple):
+    from pseudonymscript import PseudonymConfig, PseudonymizationPipeline
+    
+    config = PseudonymConfig(**dict(config_items))
+    return PseudonymizationPipeline(config, nlp=get_nlp(resolve_model(config.model_name), config.spacy_disable))
+
+
+@st.cache_data(max_entries=PSEUDONYMIZE_CACHE_ENTRIES, ttl=PSEUDONYMIZE_CACHE_TTL, show_spinner=False)
+def cached_pseudonymize(content: str, config_items: tuple) -> tuple[str, dict]:
+    return get_pipeline(config_items).pseudonymize(content)
+
 
+MONTH_NAMES = ("January", "February", "March", "April", "May", "June", "July",
+               "August", "September", "October", "November", "December")
 
-def get_entity_type(replacement):
-    if "Plaintiff" in replacement or "Defendant" in replacement or "Attorney" in replacement or "Counsel" in replacement:
-        return "Legal Person"
-    elif replacement.startswith("Person"):
-        return "Person"
-    elif replacement.startswith("ORG") or replacement.startswith("Bank"):
-        return "Company"
-    elif replacement.startswith("Country"):
-        return "Country"
-    elif replacement.startswith("State"):
-        return "State"
-    elif replacement.startswith("City"):
-        return "City"
-    elif replacement.startswith("Building"):
-        return "Building"
-    elif replacement.startswith("[ADDRESS"):
-        return "Address"
-    elif "USD" in replacement or "EUR" in replacement or "GBP" in replacement:
-        return "Money"
-    elif any(month in replacement for month in ["January", "February", "March", "April", "May", "June", "July", "August", "September", "October", "November", "December"]):
-        return "Date"
-    else:
-        return "Other"
+# Entity types are tried in order; the first rule that matches wins.
+# Each rule tests whether the replacement starts with or contains any of its tokens.
+ENTITY_TYPE_RULES = (
+    ("Legal Person", "contains", ("Plaintiff", "Defendant", "Attorney", "Counsel")),
+    ("Person", "startswith", ("Person",)),
+    ("Company", "startswith", ("ORG", "Bank")),
+    ("Country", "startswith", ("Country",)),
+    ("State", "startswith", ("State",)),
+    ("City", "startswith", ("City",)),
+    ("Building", "startswith", ("Building",)),
+    ("Address", "startswith", ("[ADDRESS",)),
+    ("Money", "contains", ("USD", "EUR", "GBP")),
+    ("Date", "contains", MONTH_NAMES)
+)
+
+# All rules folded into one ordered alternation: .match tries each rule's group in turn,
+# so the first group that matches (reported by lastgroup) is the highest-priority rule
+ENTITY_TYPE_RE = re.compile(
+    "|".join(
+        f"(?P<rule{index}>{'.*?' if test == 'contains' else ''}(?:{'|'.join(map(re.escape, tokens))}))"
+        for index, (_, test, tokens) in enumerate(ENTITY_TYPE_RULES)
+    ),
+    re.DOTALL
+)
+ENTITY_TYPE_GROUPS = {f"rule{index}": entity_type for index, (entity_type, _, _) in enumerate(ENTITY_TYPE_RULES)}
+
+# Fixed category order for the Type column
+ENTITY_TYPES = tuple(dict.fromkeys(entity_type for entity_type, _, _ in ENTITY_TYPE_RULES)) + ("Other",)
+ENTITY_TYPE_CODES = {entity_type: code for code, entity_type in enumerate(ENTITY_TYPES)}
+
+
+def preview(content: str) -> str:
+    if len(content) <= PREVIEW_CHARS:
+        return content
+    return content[:PREVIEW_CHARS] + "\n\n...[truncated, download for the full text]"
+
+
+@lru_cache(maxsize=4096)
+def classify_replacement(replacement: str) -> str:
+    match = ENTITY_TYPE_RE.match(replacement)
+    return ENTITY_TYPE_GROUPS[match.lastgroup] if match else "Other"
+
+
+def _classify_mapping(mapping: dict) -> pd.DataFrame:
+    df = pd.DataFrame({
+        "Original": list(mapping.keys()),
+        "Replaced With": list(mapping.values())
+    }, dtype=object)
+    
+    # Pseudonyms repeat across variants of the same original, so classify each distinct
+    # replacement once and broadcast the result back through the factorized codes
+    codes, replacements = pd.factorize(df["Replaced With"])
+    type_codes = np.array([ENTITY_TYPE_CODES[classify_replacement(replacement)] for replacement in replacements],
+                          dtype=np.int8)
+    df.insert(0, "Type", pd.Categorical.from_codes(type_codes[codes], categories=ENTITY_TYPES))
+    
+    return df
+
+
+def build_mapping_df(mapping: dict) -> pd.DataFrame:
+    mapping_df = _classify_mapping(mapping)
+    mapping_df["Length"] = mapping_df["Original"].str.len().astype("int32")
+    return mapping_df
+
+
+def get_mapping_df() -> pd.DataFrame:
+    if st.session_state.mapping_df is None:
+        st.session_state.mapping_df = build_mapping_df(st.session_state.replacement_mapping)
+    
+    return st.session_state.mapping_df
 
 
 def show_user_guide():
@@ -351,7 +536,15 @@ def show_document_processor():
         help="Upload TXT, DOCX, or PDF files"
     )
     
-    if uploaded_file is not None:
+    model_tier = st.selectbox(
+        "Model tier",
+        list(MODEL_TIERS),
+        index=len(MODEL_TIERS) - 1,
+        help="Faster tiers use smaller spaCy models; the regex-based extractors are unaffected"
+    )
+    model_name = MODEL_TIERS[model_tier]
+    
+    if uploaded_file is not None and (uploaded_file.file_id, model_name) != st.session_state.last_run_id:
         try:
             content, filename = DocumentProcessor.process_file(uploaded_file)
             st.session_state.original_content = content
@@ -360,17 +553,25 @@ def show_document_processor():
             st.success(f"File loaded: {filename} ({len(content):,} characters)")
 
             with st.spinner("Processing document..."):
-                config = PseudonymConfig()
+                from pseudonymscript import PseudonymConfig
+                
+                config = PseudonymConfig(model_name=model_name)
                 
                 start_time = time.time()
-                pseudonymized_content, replacement_mapping = pseudonymize_text(content, config)
+                pseudonymized_content, replacement_mapping = cached_pseudonymize(content, config_key(config))
                 processing_time = time.time() - start_time
                 
                 st.session_state.pseudonymized_content = pseudonymized_content
                 st.session_state.replacement_mapping = replacement_mapping
+                st.session_state.mapping_df = build_mapping_df(replacement_mapping)
                 st.session_state.processing_time = processing_time
+                st.session_state.last_run_id = (uploaded_file.file_id, model_name)
             
             st.success("Document processed successfully!")
+            
+            loaded_model = resolve_model(model_name)
+            if loaded_model != model_name:
+                st.warning(f"{model_name} is not installed; the nearest installed model, {loaded_model}, was used instead")
                 
         except Exception as e:
             st.error(f"Error: {str(e)}")
@@ -393,21 +594,21 @@ def show_document_processor():
         
         with col1:
             st.markdown("**Original**")
-            original_text = st.text_area(
+            st.text_area(
                 "original",
-                value=st.session_state.original_content,
+                value=preview(st.session_state.original_content),
                 height=400,
-                disabled=False,
+                disabled=True,
                 label_visibility="collapsed"
             )
         
         with col2:
             st.markdown("**Pseudonymized**")
-            pseudo_text = st.text_area(
-                "pseudonymized", 
-                value=st.session_state.pseudonymized_content,
+            st.text_area(
+                "pseudonymized",
+                value=preview(st.session_state.pseudonymized_content),
                 height=400,
-                disabled=False,
+                disabled=True,
                 label_visibility="collapsed"
             )
         
@@ -415,21 +616,15 @@ def show_document_processor():
             st.markdown("---")
             st.markdown("### Entity Mapping")
             
-            mapping_data = []
-            for original, replacement in st.session_state.replacement_mapping.items():
-                entity_type = get_entity_type(replacement)
-                
-                mapping_data.append({
-                    "Type": entity_type,
-                    "Original": original,
-                    "Replaced With": replacement
-                })
-            
-            df = pd.DataFrame(mapping_data)
+            mapping_df = get_mapping_df()
+            if len(mapping_df) > MAPPING_PAGE_SIZE:
+                st.caption(f"Showing the first {MAPPING_PAGE_SIZE} of {len(mapping_df)} entities; "
+                           "see the Entity Mapping Table tab for the rest.")
             st.dataframe(
-                df,
+                mapping_df.head(MAPPING_PAGE_SIZE),
                 use_container_width=True,
                 hide_index=True,
+                column_order=("Type", "Original", "Replaced With"),
                 column_config={
                     "Type": st.column_config.TextColumn("Type", width="small"),
                     "Original": st.column_config.TextColumn("Original Text", width="large"),
@@ -443,10 +638,9 @@ def show_document_processor():
         col1, col2, col3 = st.columns(3)
         
         with col1:
-            pdf_buffer = create_pdf(st.session_state.pseudonymized_content, st.session_state.filename)
             st.download_button(
                 label="Download as PDF",
-                data=pdf_buffer.getvalue(),
+                data=cached_pdf(st.session_state.pseudonymized_content, st.session_state.filename),
                 file_name=f"pseudonymized_{Path(st.session_state.filename).stem}.pdf",
                 mime="application/pdf"
             )
@@ -461,10 +655,9 @@ def show_document_processor():
         
         with col3:
             if st.session_state.replacement_mapping:
-                mapping_pdf = create_mapping_pdf(st.session_state.replacement_mapping)
                 st.download_button(
                     label="Download Mapping PDF",
-                    data=mapping_pdf.getvalue(),
+                    data=cached_mapping_pdf(st.session_state.replacement_mapping),
                     file_name="entity_mapping.pdf",
                     mime="application/pdf"
                 )
@@ -485,18 +678,8 @@ def show_entity_mapping_table():
     st.markdown("---")
     
     if st.session_state.replacement_mapping:
-        mapping_data = []
-        for original, replacement in st.session_state.replacement_mapping.items():
-            entity_type = get_entity_type(replacement)
-            
-            mapping_data.append({
-                "Type": entity_type,
-                "Original": original,
-                "Replaced With": replacement,
-                "Length": len(original)
-            })
-        
-        df = pd.DataFrame(mapping_data)
+        df = get_mapping_df()
+        total_entities = len(df)
         
         col1, col2 = st.columns([1, 3])
         
@@ -510,12 +693,19 @@ def show_entity_mapping_table():
         with col2:
             search_term = st.text_input("Search original text:", placeholder="Enter text to search...")
             if search_term:
-                df = df[df["Original"].str.contains(search_term, case=False, na=False)]
+                df = df[df["Original"].str.contains(search_term, case=False, na=False, regex=False)]
+        
+        st.markdown(f"**Showing {len(df)} of {total_entities} entities**")
         
-        st.markdown(f"**Showing {len(df)} of {len(mapping_data)} entities**")
+        # Only the current page is sent to the browser; exports below still use the full filtered df
+        page_df = df
+        if len(df) > MAPPING_PAGE_SIZE:
+            page_count = -(-len(df) // MAPPING_PAGE_SIZE)
+            page = st.number_input(f"Page (of {page_count})", min_value=1, max_value=page_count, value=1)
+            page_df = df.iloc[(page - 1) * MAPPING_PAGE_SIZE:page * MAPPING_PAGE_SIZE]
         
         st.dataframe(
-            df,
+            page_df,
             use_container_width=True,
             hide_index=True,
             column_config={
@@ -540,8 +730,9 @@ def show_entity_mapping_table():
                 st.metric("Avg. Length", f"{avg_length:.1f}")
             
             with col3:
-                max_length = df["Length"].max()
-                longest = df[df["Length"] == max_length]["Original"].iloc[0]
+                longest_position = df["Length"].to_numpy().argmax()
+                max_length = df["Length"].iloc[longest_position]
+                longest = df["Original"].iloc[longest_position]
                 st.metric("Longest Text", f"{max_length} chars")
                 st.caption(f'"{longest[:30]}..."' if len(longest) > 30 else f'"{longest}"')
             
@@ -576,11 +767,12 @@ def show_entity_mapping_table():
         
         with col3:
             if len(df) > 0:
-                mapping_dict = dict(zip(df["Original"], df["Replaced With"]))
-                mapping_pdf = create_mapping_pdf(mapping_dict)
+                mapping = st.session_state.replacement_mapping
+                if len(df) < total_entities:
+                    mapping = {original: mapping[original] for original in df["Original"].to_numpy()}
                 st.download_button(
                     label="Download as PDF",
-                    data=mapping_pdf.getvalue(),
+                    data=cached_mapping_pdf(mapping),
                     file_name="entity_mapping_filtered.pdf",
                     mime="application/pdf"
                 )
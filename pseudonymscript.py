@@ -17,8 +17,8 @@ Architecture:
 - PseudonymizationPipeline -> coordinates all extractors and pseudonymizers
 """
 
-import spacy
 import random
+import calendar
 import datetime
 import re
 import logging
@@ -27,21 +27,126 @@ from typing import List
 from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
 from abc import ABC, abstractmethod
+from bisect import bisect_left, bisect_right
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from importlib.util import find_spec
+from operator import attrgetter
 
 # ============================================================================
 # SHARED UTILITIES
 # ============================================================================
 
+# Replacement candidates for small values, indexed by the value's integer part
+_SMALL_ALTERNATIVES = tuple(
+    tuple(x for x in range(1, 11) if x != value) for value in range(11)
+)
+
+
 class NumberRandomizer:
     """Shared logic for randomizing numerical values"""
     @staticmethod
     def randomize_number(value: float, preserve_small: bool = True) -> float:
         if preserve_small and 0 < value <= 10:
-            return random.choice([x for x in range(1, 11) if x != int(value)])
+            return random.choice(_SMALL_ALTERNATIVES[int(value)])
         else:
             multiplier = random.uniform(0.85, 1.15)
             return value * multiplier
 
+    @staticmethod
+    def randomize_int(value: int, preserve_small: bool = True) -> int:
+        """Integer counterpart of randomize_number; draws the same random values"""
+        if preserve_small and 0 < value <= 10:
+            return random.choice(_SMALL_ALTERNATIVES[value])
+        return int(round(value * random.uniform(0.85, 1.15)))
+
+
+# Names, places and addresses recur across mentions and documents, while pseudonymizers
+# are rebuilt for every document, so pure helpers like this one are cached at module level
+@lru_cache(maxsize=4096)
+def _hash_letter(hash_input: str) -> str:
+    """Stable letter A-Z derived from the SHA-256 of hash_input"""
+    digest = hashlib.sha256(hash_input.encode('utf-8')).digest()
+    return chr(ord('A') + digest[0] % 26)
+
+
+class SpanIndex:
+    """Non-overlapping spans kept sorted by start, for O(log n) overlap checks"""
+    def __init__(self):
+        self.starts: List[int] = []
+        self.ends: List[int] = []
+    
+    def overlaps(self, start: int, end: int) -> bool:
+        # Accepted spans never overlap, so only the last one starting before `end` can reach past `start`
+        i = bisect_left(self.starts, end) - 1
+        return i >= 0 and self.ends[i] > start
+    
+    def add(self, start: int, end: int) -> int:
+        """Insert a span and return its position, so parallel lists can stay in start order"""
+        i = bisect_right(self.starts, start)
+        self.starts.insert(i, start)
+        self.ends.insert(i, end)
+        return i
+
+
+# Regexes for the strptime directives used by the date formats, written as strptime builds them
+_DATE_DIRECTIVE_PATTERNS = {
+    'd': r"(?P<d>3[0-1]|[1-2]\d|0[1-9]|[1-9]| [1-9])",
+    'm': r"(?P<m>1[0-2]|0[1-9]|[1-9])",
+    'Y': r"(?P<Y>\d\d\d\d)",
+    'B': "(?P<B>" + "|".join(sorted(map(str.lower, calendar.month_name[1:]), key=len, reverse=True)) + ")",
+    'b': "(?P<b>" + "|".join(sorted(map(str.lower, calendar.month_abbr[1:]), key=len, reverse=True)) + ")"
+}
+_MONTH_NUMBERS = {
+    name.lower(): number
+    for names in (calendar.month_name, calendar.month_abbr)
+    for number, name in enumerate(names) if name
+}
+
+
+@lru_cache(maxsize=None)
+def _compile_date_format(date_format: str) -> Optional["re.Pattern"]:
+    """Translate a day/month/year strptime format into an equivalent regex, or None if unsupported"""
+    parts = re.split(r"%(.)", date_format)
+    literals, directives = parts[0::2], parts[1::2]
+    
+    if sorted(directives) not in (['B', 'Y', 'd'], ['Y', 'b', 'd'], ['Y', 'd', 'm']):
+        return None
+    
+    # strptime matches any run of whitespace in the format against \s+
+    pattern = "".join(
+        r"\s+".join(map(re.escape, re.split(r"\s+", literal))) + _DATE_DIRECTIVE_PATTERNS.get(directive, "")
+        for literal, directive in zip(literals, directives + [""])
+    )
+    return re.compile(pattern, re.IGNORECASE)
+
+
+@lru_cache(maxsize=4096)
+def parse_date(date_str: str, date_formats: Tuple[str, ...]) -> Optional[datetime.date]:
+    """Parse a date with the first matching format (cached, as dates repeat)"""
+    for date_format in date_formats:
+        pattern = _compile_date_format(date_format)
+        
+        if pattern is None:
+            try:
+                return datetime.datetime.strptime(date_str, date_format).date()
+            except ValueError:
+                continue
+        
+        # Regex dispatch avoids strptime's exception on every non-matching format
+        match = pattern.fullmatch(date_str)
+        if not match:
+            continue
+        
+        fields = match.groupdict()
+        month_name = fields.get('B') or fields.get('b')
+        month = _MONTH_NUMBERS[month_name.lower()] if month_name else int(fields['m'])
+        try:
+            return datetime.date(int(fields['Y']), month, int(fields['d']))
+        except ValueError:
+            continue
+    return None
+
 
 # ============================================================================
 # DATA STRUCTURES
@@ -73,6 +178,11 @@ class PseudonymConfig:
     enable_legal_person_extraction: bool = True
     enable_spacy_extraction: bool = True
     
+    # Only doc.ents is used, so components that don't feed NER are skipped when loading
+    spacy_disable: Tuple[str, ...] = ("tagger", "parser", "attribute_ruler", "lemmatizer")
+    spacy_batch_size: int = 64
+    spacy_max_chunk_chars: int = 5000
+    
     def __post_init__(self):
         self.target_labels = {"PERSON", "ORG", "GPE", "MONEY", "NUMBER", "ADDRESS", "DATE", "FAC", "LEGAL_PERSON"}
 
@@ -126,28 +236,34 @@ class EntityPseudonymizer(ABC):
 # DATE HANDLING
 # ============================================================================
 
+# Month names factored by shared prefix, so a failed month costs one or two character tests
+# rather than a walk through all twelve alternatives
+_MONTHS = r"(?:J(?:anuary|u(?:ne|ly))|February|Ma(?:rch|y)|A(?:pril|ugust)|September|October|November|December)"
+_MONTH_ABBREVIATIONS = r"(?:J(?:an|u[nl])|Feb|Ma[ry]|A(?:pr|ug)|Sep|Oct|Nov|Dec)"
+
+# Each alternative captures the date itself in a group named after the pattern;
+# at each position the alternatives are tried in this order
+_DATE_PATTERNS = {
+    'no_later_than': rf"\bno\s+later\s+than\s+(?P<no_later_than>\d{{1,2}}\s+{_MONTHS}\s+\d{{4}})\b",
+    'day_month_year': rf"\b(?P<day_month_year>\d{{1,2}}\s+{_MONTHS}\s+\d{{4}})\b",
+    'month_day_year': rf"\b(?P<month_day_year>{_MONTHS}\s+\d{{1,2}},?\s+\d{{4}})\b",
+    'abbreviated_months': rf"\b(?P<abbreviated_months>\d{{1,2}}\s+{_MONTH_ABBREVIATIONS}\s+\d{{4}})\b"
+}
+_DATE_PATTERN = re.compile("|".join(_DATE_PATTERNS.values()), re.IGNORECASE)
+
+# Case-sensitive, like the substring checks they replace
+_MONTH_NAME_PATTERN = re.compile(
+    "January|February|March|April|May|June|July|August|September|October|November|December"
+)
+_MONTH_ABBR_PATTERN = re.compile("Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec")
+
+
 class DateExtractor(EntityExtractor):
     """Extracts dates with context awareness"""
     
     def __init__(self):
-        self.date_patterns = {
-            'no_later_than': re.compile(
-                r"\bno\s+later\s+than\s+(\d{1,2}\s+(?:January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{4})\b", 
-                re.IGNORECASE
-            ),
-            'day_month_year': re.compile(
-                r"\b(\d{1,2}\s+(?:January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{4})\b",
-                re.IGNORECASE
-            ),
-            'month_day_year': re.compile(
-                r"\b((?:January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{1,2},?\s+\d{4})\b",
-                re.IGNORECASE
-            ),
-            'abbreviated_months': re.compile(
-                r"\b(\d{1,2}\s+(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+\d{4})\b",
-                re.IGNORECASE
-            )
-        }
+        # One scan over the text covers every date format
+        self.date_pattern = _DATE_PATTERN
     
     @property
     def entity_types(self) -> List[str]:
@@ -156,21 +272,17 @@ class DateExtractor(EntityExtractor):
     def extract(self, text: str) -> List[Entity]:
         entities = []
         
-        for pattern_name, pattern in self.date_patterns.items():
-            for match in pattern.finditer(text):
-                date_text = match.group(1).strip()
-                start_pos = match.start(1)
-                end_pos = match.end(1)
-                
-                if not self._overlaps_existing(start_pos, end_pos, entities):
-                    entities.append(Entity(
-                        start=start_pos,
-                        end=end_pos,
-                        label="DATE",
-                        text=date_text
-                    ))
+        # finditer matches never overlap and arrive in text order
+        for match in self.date_pattern.finditer(text):
+            start_pos, end_pos = match.span(match.lastgroup)
+            entities.append(Entity(
+                start=start_pos,
+                end=end_pos,
+                label="DATE",
+                text=match.group(match.lastgroup).strip()
+            ))
         
-        return sorted(entities, key=lambda x: x.start)
+        return entities
 
 
 class DatePseudonymizer(EntityPseudonymizer):
@@ -179,22 +291,27 @@ class DatePseudonymizer(EntityPseudonymizer):
     def __init__(self):
         super().__init__()
         self.date_mapping: Dict[datetime.date, datetime.date] = {}
+        # Parse results from prepare(), keyed by entity text, so pseudonymize() can reuse them
+        self.parsed_dates: Dict[str, Optional[datetime.date]] = {}
         
-        self.date_formats = [
+        self.date_formats = (
             '%d %B %Y', '%B %d %Y', '%B %d, %Y', '%d %b %Y',
             '%b %d %Y', '%b %d, %Y', '%Y-%m-%d', '%d/%m/%Y',
             '%m/%d/%Y', '%d-%m-%Y', '%m-%d-%Y'
-        ]
+        )
     
     def prepare(self, all_entities: List[Entity]) -> None:
         date_entities = [e for e in all_entities if e.label == "DATE"]
+        self.parsed_dates = {}
         if not date_entities:
             self.date_mapping = {}
             return
         
         parsed_dates = []
         for entity in date_entities:
-            parsed_date = self._parse_date(entity.text)
+            if entity.text not in self.parsed_dates:
+                self.parsed_dates[entity.text] = self._parse_date(entity.text)
+            parsed_date = self.parsed_dates[entity.text]
             if parsed_date:
                 parsed_dates.append(parsed_date)
         
@@ -222,14 +339,16 @@ class DatePseudonymizer(EntityPseudonymizer):
         base_date = datetime.date(2010, 1, 1)
         new_start_date = base_date + datetime.timedelta(days=random_days)
         
-        self.date_mapping = {}
-        for original_date in unique_dates:
-            days_from_start = (original_date - earliest_date).days
-            new_date = new_start_date + datetime.timedelta(days=days_from_start)
-            self.date_mapping[original_date] = new_date
+        # Every date moves by the same offset, which keeps the intervals between them
+        shift = new_start_date - earliest_date
+        self.date_mapping = {original_date: original_date + shift for original_date in unique_dates}
     
     def pseudonymize(self, original_text: str, entity_label: str) -> str:
-        parsed_date = self._parse_date(original_text.strip())
+        date_str = original_text.strip()
+        if date_str in self.parsed_dates:
+            parsed_date = self.parsed_dates[date_str]
+        else:
+            parsed_date = self._parse_date(date_str)
         
         if parsed_date and parsed_date in self.date_mapping:
             shifted_date = self.date_mapping[parsed_date]
@@ -238,19 +357,12 @@ class DatePseudonymizer(EntityPseudonymizer):
             return f"[UNPARSEABLE DATE: {original_text}]"
     
     def _parse_date(self, date_str: str) -> Optional[datetime.date]:
-        for date_format in self.date_formats:
-            try:
-                return datetime.datetime.strptime(date_str, date_format).date()
-            except ValueError:
-                continue
-        return None
+        return parse_date(date_str, self.date_formats)
     
     def _format_date_like_original(self, date_obj: datetime.date, original_str: str) -> str:
-        if any(month in original_str for month in ['January', 'February', 'March', 'April', 'May', 'June', 
-                                                   'July', 'August', 'September', 'October', 'November', 'December']):
+        if _MONTH_NAME_PATTERN.search(original_str):
             return date_obj.strftime('%d %B %Y')
-        elif any(month in original_str for month in ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun',
-                                                     'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']):
+        elif _MONTH_ABBR_PATTERN.search(original_str):
             return date_obj.strftime('%d %b %Y')
         elif '-' in original_str:
             if original_str.startswith('20') or original_str.startswith('19'):
@@ -267,42 +379,62 @@ class DatePseudonymizer(EntityPseudonymizer):
 # ORGANIZATION HANDLING
 # ============================================================================
 
+CORPORATE_SUFFIXES = (
+    "Pte Ltd", "Pvt Ltd", "Private Limited", "Ltd", "Limited",
+    "LLP", "LLC", "PLLC", "LP", "L.P.", "L.L.C.", "L.L.P.",
+    "Inc", "Incorporated", "Corp", "Corporation", 
+    "Co", "Company", "Holdings", "Group", "PLC", "plc",
+    "AG", "GmbH", "S.A.", "SAS", "SARL", "B.V.", "N.V.",
+    "Pty Ltd", "Pty Limited"
+)
+
+
+def _build_company_patterns(corporate_suffixes) -> List["re.Pattern"]:
+    long_suffixes = [s for s in corporate_suffixes if len(s) > 2]
+    short_suffixes = [s for s in corporate_suffixes if len(s) <= 2]
+    
+    long_suffix_pattern = "|".join([re.escape(suffix) for suffix in long_suffixes])
+    short_suffix_pattern = "|".join([rf"\b{re.escape(suffix)}\b" for suffix in short_suffixes])
+    
+    if long_suffixes and short_suffixes:
+        suffix_pattern = f"(?:{long_suffix_pattern}|{short_suffix_pattern})"
+    elif long_suffixes:
+        suffix_pattern = long_suffix_pattern
+    else:
+        suffix_pattern = short_suffix_pattern
+    
+    return [
+        re.compile(rf"\b([A-Z]{{2,4}}\s+Bank\s+(?:{suffix_pattern})(?:,\s+[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\s+Branch)?)", re.IGNORECASE),
+        re.compile(rf"(?<!of\s)\b([A-Z][A-Za-z]+(?:\s+[A-Z][A-Za-z]+){{0,2}}\s+(?:{suffix_pattern}))", re.IGNORECASE),
+    ]
+
+
+_COMPANY_PATTERNS = _build_company_patterns(CORPORATE_SUFFIXES)
+_NAME_LETTERS_PATTERN = re.compile(r'[A-Za-z]{2,}')
+
+# Longest suffixes first, so e.g. "Pte Ltd" is preferred over "Ltd"
+_SUFFIX_AT_END_PATTERN = re.compile(
+    "(?:" + "|".join(re.escape(suffix) for suffix in sorted(CORPORATE_SUFFIXES, key=len, reverse=True)) + r")\Z",
+    re.IGNORECASE
+)
+_MAX_SUFFIX_LENGTH = max(len(suffix) for suffix in CORPORATE_SUFFIXES)
+_BRANCH_PATTERN = re.compile(r',\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\s+Branch', re.IGNORECASE)
+_BRANCH_TAIL_PATTERN = re.compile(r',\s+[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\s+Branch.*$', re.IGNORECASE)
+_TRAILING_PUNCTUATION_PATTERN = re.compile(r'[.,;:]+\s*$')
+
+
 class OrganizationExtractor(EntityExtractor):
     """Extracts organization names using comprehensive regex patterns"""
     
     def __init__(self):
-        self.corporate_suffixes = [
-            "Pte Ltd", "Pvt Ltd", "Private Limited", "Ltd", "Limited",
-            "LLP", "LLC", "PLLC", "LP", "L.P.", "L.L.C.", "L.L.P.",
-            "Inc","Incorporated", "Corp", "Corporation", 
-            "Co", "Company", "Holdings", "Group", "PLC", "plc",
-            "AG", "GmbH", "S.A.", "SAS", "SARL", "B.V.", "N.V.",
-            "Pty Ltd", "Pty Limited"
-        ]
-        
-        long_suffixes = [s for s in self.corporate_suffixes if len(s) > 2]
-        short_suffixes = [s for s in self.corporate_suffixes if len(s) <= 2]
-        
-        long_suffix_pattern = "|".join([re.escape(suffix) for suffix in long_suffixes])
-        short_suffix_pattern = "|".join([rf"\b{re.escape(suffix)}\b" for suffix in short_suffixes])
+        self.corporate_suffixes = CORPORATE_SUFFIXES
+        self.company_patterns = _COMPANY_PATTERNS
         
-        if long_suffixes and short_suffixes:
-            suffix_pattern = f"(?:{long_suffix_pattern}|{short_suffix_pattern})"
-        elif long_suffixes:
-            suffix_pattern = long_suffix_pattern
-        else:
-            suffix_pattern = short_suffix_pattern
-        
-        self.company_patterns = [
-            re.compile(rf"\b([A-Z]{{2,4}}\s+Bank\s+(?:{suffix_pattern})(?:,\s+[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\s+Branch)?)", re.IGNORECASE),
-            re.compile(rf"(?<!of\s)\b([A-Z][A-Za-z]+(?:\s+[A-Z][A-Za-z]+){{0,2}}\s+(?:{suffix_pattern}))", re.IGNORECASE),
-        ]
-        
-        self.exclusion_words = {
+        self.exclusion_words = frozenset({
             "payable", "transfer", "wire", "to", "by", "from", 
             "agreed", "sell", "having", "incorporated", "and", "with", "signed",
             "the", "this", "that", "said", "such", "other", "any", "all", "of"
-        }
+        })
 
     @property
     def entity_types(self) -> List[str]:
@@ -310,33 +442,32 @@ class OrganizationExtractor(EntityExtractor):
 
     def extract(self, text: str) -> List[Entity]:
         entities = []
+        spans = SpanIndex()
         
         for pattern in self.company_patterns:
             for match in pattern.finditer(text):
                 company_name = match.group(1).strip() if match.lastindex and match.lastindex >= 1 else match.group(0).strip()
+                start_pos, end_pos = match.span()
                 
                 if (len(company_name) > 5
                     and not self._contains_exclusion_words(company_name)
-                    and not self._overlaps_existing(match.start(), match.end(), entities)
+                    and not spans.overlaps(start_pos, end_pos)
                     and self._is_valid_company_name(company_name)):
                     
-                    entities.append(Entity(
-                        start=match.start(),
-                        end=match.end(),
+                    index = spans.add(start_pos, end_pos)
+                    entities.insert(index, Entity(
+                        start=start_pos,
+                        end=end_pos,
                         label="ORG",
                         text=company_name
                     ))
         
-        return sorted(entities, key=lambda x: x.start)
+        return entities
 
     def _contains_exclusion_words(self, text: str) -> bool:
-        text_lower = text.lower()
-        words = text_lower.split()
-        
-        for word in words[:-2]:
-            if word in self.exclusion_words:
-                return True
-        return False
+        # The last two words are the name's tail and suffix, so they are never checked;
+        # lowering word by word stops at the first hit and skips short names entirely
+        return any(word.lower() in self.exclusion_words for word in text.split()[:-2])
     
     def _is_valid_company_name(self, text: str) -> bool:
         words = text.split()
@@ -345,7 +476,7 @@ class OrganizationExtractor(EntityExtractor):
         
         name_part = " ".join(words[:-1]) if len(words) > 1 else words[0]
         
-        if not re.search(r'[A-Za-z]{2,}', name_part):
+        if not _NAME_LETTERS_PATTERN.search(name_part):
             return False
             
         first_word = words[0].lower()
@@ -362,20 +493,13 @@ class OrganizationPseudonymizer(EntityPseudonymizer):
         super().__init__()
         self.counter = 0
         
-        self.corporate_suffixes = [
-            "Pte Ltd", "Pvt Ltd", "Private Limited", "Ltd", "Limited",
-            "LLP", "LLC", "PLLC", "LP", "L.P.", "L.L.C.", "L.L.P.",
-            "Inc", "Incorporated", "Corp", "Corporation", 
-            "Co", "Company", "Holdings", "Group", "PLC", "plc",
-            "AG", "GmbH", "S.A.", "SAS", "SARL", "B.V.", "N.V.",
-            "Pty Ltd", "Pty Limited"
-        ]
+        self.corporate_suffixes = CORPORATE_SUFFIXES
 
     def pseudonymize(self, original_text: str, entity_label: str) -> str:
         self.counter += 1
         letter = chr(ord("A") + (self.counter - 1) % 26)
         
-        branch_match = re.search(r',\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\s+Branch', original_text, re.IGNORECASE)
+        branch_match = _BRANCH_PATTERN.search(original_text)
         suffix = self._extract_corporate_suffix(original_text)
         
         if branch_match and suffix:
@@ -386,33 +510,72 @@ class OrganizationPseudonymizer(EntityPseudonymizer):
             return f"ORG {letter}"
     
     def _extract_corporate_suffix(self, text: str) -> str:
-        text_without_branch = re.sub(r',\s+[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\s+Branch.*$', '', text, flags=re.IGNORECASE)
-        text_clean = re.sub(r'[.,;:]+\s*$', '', text_without_branch.strip())
+        text_without_branch = _BRANCH_TAIL_PATTERN.sub('', text)
+        text_clean = _TRAILING_PUNCTUATION_PATTERN.sub('', text_without_branch.strip())
         
-        sorted_suffixes = sorted(self.corporate_suffixes, key=len, reverse=True)
-        
-        for suffix in sorted_suffixes:
-            if text_clean.lower().endswith(suffix.lower()):
-                start_pos = len(text_clean) - len(suffix)
-                return text_clean[start_pos:]
-        
-        return ""
+        # A suffix can only start within the last _MAX_SUFFIX_LENGTH characters; the leftmost
+        # match there is the longest suffix the text ends with
+        match = _SUFFIX_AT_END_PATTERN.search(text_clean, max(0, len(text_clean) - _MAX_SUFFIX_LENGTH))
+        return match.group() if match else ""
 
 
 # ============================================================================
 # MONEY HANDLING
 # ============================================================================
 
+_CURRENCY_CODES = r"(USD|EUR|GBP|CAD|AUD|SGD|HKD|JPY|CNY|CHF|SEK|NOK|DKK)"
+
+# "(?:,\d{3})*" after "[\d,]+" matched nothing the class didn't already cover, but let a long
+# digit run be split between the two in every possible way (cubic backtracking); the
+# written form also never starts inside a run, since the run's end decides the match
+_MONEY_PATTERNS = [
+    re.compile(_CURRENCY_CODES + r"\s+[\d,]+(?:\.\d{2})?\s+\([^)]*(?:dollars?|euros?|pounds?|yen|yuan|francs?|krona|krone)[^)]*\)", re.IGNORECASE),
+    re.compile(_CURRENCY_CODES + r"\s+[\d,]+(?:\.\d{2})?", re.IGNORECASE),
+    re.compile(r"[\$€£¥₹₩₪₽¢]\s*[\d,]+(?:\.\d{2})?"),
+    re.compile(r"(?<![\d,])[\d,]+(?:\.\d{2})?\s+(?:dollars?|euros?|pounds?|yen|yuan|francs?|krona|krone)", re.IGNORECASE)
+]
+
+# Money formats in priority order. Each alternative is ".*?"-prefixed and anchored with
+# .match, so the first format found anywhere in the text wins, as with one search per format
+_MONEY_FORMAT_DISPATCH = re.compile(
+    r".*?(?P<full>(?P<full_code>USD|EUR|GBP|CAD|AUD|SGD|HKD|JPY|CNY|CHF|SEK|NOK|DKK)\s+(?P<full_amount>[\d,]+(?:\.\d{2})?)\s+\((?P<full_words>[^)]*)\))"
+    r"|.*?(?P<code>(?P<code_currency>USD|EUR|GBP|CAD|AUD|SGD|HKD|JPY|CNY|CHF|SEK|NOK|DKK)\s+(?P<code_amount>[\d,]+(?:\.\d{2})?))"
+    r"|.*?(?P<symbol>(?P<symbol_sign>[\$€£¥₹₩₪₽¢])\s*(?P<symbol_amount>[\d,]+(?:\.\d{2})?))"
+    r"|.*?(?P<written>(?P<written_amount>[\d,]+(?:\.\d{2})?)\s+(?P<written_word>dollars?|euros?|pounds?|yen|yuan|francs?|krona|krone))",
+    re.IGNORECASE | re.DOTALL
+)
+
+_ONES = ("", "One", "Two", "Three", "Four", "Five", "Six", "Seven", "Eight", "Nine",
+         "Ten", "Eleven", "Twelve", "Thirteen", "Fourteen", "Fifteen", "Sixteen",
+         "Seventeen", "Eighteen", "Nineteen")
+_TENS = ("", "", "Twenty", "Thirty", "Forty", "Fifty", "Sixty", "Seventy", "Eighty", "Ninety")
+
+
+def _spell_hundreds(num: int) -> str:
+    if num == 0:
+        return ""
+    
+    if num < 20:
+        return _ONES[num]
+    elif num < 100:
+        return _TENS[num // 10] + ("-" + _ONES[num % 10] if num % 10 != 0 else "")
+    else:
+        result = _ONES[num // 100] + " Hundred"
+        remainder = num % 100
+        if remainder > 0:
+            result += " " + _spell_hundreds(remainder)
+        return result
+
+
+# Every 0-999 group spelled out once, so converting an amount is a few table lookups
+_HUNDREDS_WORDS = tuple(_spell_hundreds(num) for num in range(1000))
+
+
 class MoneyExtractor(EntityExtractor):
     """Extracts money amounts in multiple currencies"""
     
     def __init__(self):
-        self.money_patterns = [
-            re.compile(r"(USD|EUR|GBP|CAD|AUD|SGD|HKD|JPY|CNY|CHF|SEK|NOK|DKK)\s+[\d,]+(?:,\d{3})*(?:\.\d{2})?\s+\([^)]*(?:dollars?|euros?|pounds?|yen|yuan|francs?|krona|krone)[^)]*\)", re.IGNORECASE),
-            re.compile(r"(USD|EUR|GBP|CAD|AUD|SGD|HKD|JPY|CNY|CHF|SEK|NOK|DKK)\s+[\d,]+(?:,\d{3})*(?:\.\d{2})?", re.IGNORECASE),
-            re.compile(r"[\$€£¥₹₩₪₽¢]\s*[\d,]+(?:,\d{3})*(?:\.\d{2})?"),
-            re.compile(r"[\d,]+(?:,\d{3})*(?:\.\d{2})?\s+(?:dollars?|euros?|pounds?|yen|yuan|francs?|krona|krone)", re.IGNORECASE)
-        ]
+        self.money_patterns = _MONEY_PATTERNS
     
     @property
     def entity_types(self) -> List[str]:
@@ -420,18 +583,21 @@ class MoneyExtractor(EntityExtractor):
     
     def extract(self, text: str) -> List[Entity]:
         entities = []
+        spans = SpanIndex()
         
         for pattern in self.money_patterns:
             for match in pattern.finditer(text):
-                if not self._overlaps_existing(match.start(), match.end(), entities):
-                    entities.append(Entity(
-                        start=match.start(),
-                        end=match.end(),
+                start_pos, end_pos = match.span()
+                if not spans.overlaps(start_pos, end_pos):
+                    index = spans.add(start_pos, end_pos)
+                    entities.insert(index, Entity(
+                        start=start_pos,
+                        end=end_pos,
                         label="MONEY",
                         text=match.group(0)
                     ))
         
-        return sorted(entities, key=lambda x: x.start)
+        return entities
 
 
 class MoneyPseudonymizer(EntityPseudonymizer):
@@ -454,99 +620,61 @@ class MoneyPseudonymizer(EntityPseudonymizer):
         }
 
     def pseudonymize(self, original_text: str, entity_label: str) -> str:
-        result = self._handle_full_format(original_text)
-        if result: return result
+        match = _MONEY_FORMAT_DISPATCH.match(original_text)
         
-        result = self._handle_currency_code_format(original_text)
-        if result: return result
-        
-        result = self._handle_symbol_format(original_text)
-        if result: return result
-        
-        result = self._handle_written_format(original_text)
-        if result: return result
+        if match:
+            handlers = {
+                "full": self._handle_full_format,
+                "code": self._handle_currency_code_format,
+                "symbol": self._handle_symbol_format,
+                "written": self._handle_written_format
+            }
+            return handlers[match.lastgroup](match)
         
         return "[REDACTED AMOUNT]"
     
-    def _handle_full_format(self, text: str) -> str:
-        pattern = r"(USD|EUR|GBP|CAD|AUD|SGD|HKD|JPY|CNY|CHF|SEK|NOK|DKK)\s+([\d,]+(?:\.\d{2})?)\s+\(([^)]*)\)"
-        match = re.search(pattern, text, re.IGNORECASE)
+    def _handle_full_format(self, match: re.Match) -> str:
+        currency = match.group("full_code").upper()
+        amount_str = match.group("full_amount").replace(',', '')
+        original_amount = float(amount_str)
         
-        if match:
-            currency = match.group(1).upper()
-            amount_str = match.group(2).replace(',', '')
-            original_amount = float(amount_str)
-            
-            new_amount = NumberRandomizer.randomize_number(original_amount, preserve_small=False)
-            new_amount_int = int(round(new_amount))
-            formatted_amount = f"{new_amount_int:,}"
-            
-            written_amount = self._number_to_written(new_amount_int)
-            currency_word = self.currency_words.get(currency, "Units")
-            
-            return f"{currency} {formatted_amount} ({written_amount} {currency_word})"
+        new_amount = NumberRandomizer.randomize_number(original_amount, preserve_small=False)
+        new_amount_int = int(round(new_amount))
+        formatted_amount = format(new_amount_int, ",d")
         
-        return None
-    
-    def _handle_currency_code_format(self, text: str) -> str:
-        pattern = r"(USD|EUR|GBP|CAD|AUD|SGD|HKD|JPY|CNY|CHF|SEK|NOK|DKK)\s+([\d,]+(?:\.\d{2})?)"
-        match = re.search(pattern, text, re.IGNORECASE)
+        written_amount = self._number_to_written(new_amount_int)
+        currency_word = self.currency_words.get(currency, "Units")
         
-        if match:
-            currency = match.group(1).upper()
-            amount_str = match.group(2).replace(',', '')
-            original_amount = float(amount_str)
-            
-            new_amount = NumberRandomizer.randomize_number(original_amount, preserve_small=False)
-            
-            if '.' in amount_str:
-                formatted_amount = f"{new_amount:,.2f}"
-            else:
-                formatted_amount = f"{int(round(new_amount)):,}"
-            
-            return f"{currency} {formatted_amount}"
-        
-        return None
+        return f"{currency} {formatted_amount} ({written_amount} {currency_word})"
     
-    def _handle_symbol_format(self, text: str) -> str:
-        pattern = r"([\$€£¥₹₩₪₽¢])\s*([\d,]+(?:\.\d{2})?)"
-        match = re.search(pattern, text)
+    def _handle_currency_code_format(self, match: re.Match) -> str:
+        currency = match.group("code_currency").upper()
+        amount_str = match.group("code_amount").replace(',', '')
+        formatted_amount = self._randomize_amount(amount_str)
         
-        if match:
-            symbol = match.group(1)
-            amount_str = match.group(2).replace(',', '')
-            original_amount = float(amount_str)
-            
-            new_amount = NumberRandomizer.randomize_number(original_amount, preserve_small=False)
-            
-            if '.' in amount_str:
-                formatted_amount = f"{new_amount:,.2f}"
-            else:
-                formatted_amount = f"{int(round(new_amount)):,}"
-            
-            return f"{symbol}{formatted_amount}"
+        return f"{currency} {formatted_amount}"
+    
+    def _handle_symbol_format(self, match: re.Match) -> str:
+        symbol = match.group("symbol_sign")
+        amount_str = match.group("symbol_amount").replace(',', '')
+        formatted_amount = self._randomize_amount(amount_str)
         
-        return None
+        return f"{symbol}{formatted_amount}"
     
-    def _handle_written_format(self, text: str) -> str:
-        pattern = r"([\d,]+(?:\.\d{2})?)\s+(dollars?|euros?|pounds?|yen|yuan|francs?|krona|krone)"
-        match = re.search(pattern, text, re.IGNORECASE)
+    def _handle_written_format(self, match: re.Match) -> str:
+        amount_str = match.group("written_amount").replace(',', '')
+        currency_word = match.group("written_word").lower()
+        formatted_amount = self._randomize_amount(amount_str)
         
-        if match:
-            amount_str = match.group(1).replace(',', '')
-            currency_word = match.group(2).lower()
-            original_amount = float(amount_str)
-            
-            new_amount = NumberRandomizer.randomize_number(original_amount, preserve_small=False)
-            
-            if '.' in amount_str:
-                formatted_amount = f"{new_amount:,.2f}"
-            else:
-                formatted_amount = f"{int(round(new_amount)):,}"
-            
-            return f"{formatted_amount} {currency_word}"
+        return f"{formatted_amount} {currency_word}"
+    
+    def _randomize_amount(self, amount_str: str) -> str:
+        new_amount = NumberRandomizer.randomize_number(float(amount_str), preserve_small=False)
         
-        return None
+        # Keep cents only when the original amount had them
+        if '.' in amount_str:
+            return format(new_amount, ",.2f")
+        return format(int(round(new_amount)), ",d")
     
     def _number_to_written(self, amount: int) -> str:
         if amount == 0:
@@ -579,51 +707,52 @@ class MoneyPseudonymizer(EntityPseudonymizer):
             return self._convert_hundreds(amount)
     
     def _convert_hundreds(self, num: int) -> str:
-        if num == 0:
-            return ""
-        
-        ones = ["", "One", "Two", "Three", "Four", "Five", "Six", "Seven", "Eight", "Nine",
-                "Ten", "Eleven", "Twelve", "Thirteen", "Fourteen", "Fifteen", "Sixteen",
-                "Seventeen", "Eighteen", "Nineteen"]
-        tens = ["", "", "Twenty", "Thirty", "Forty", "Fifty", "Sixty", "Seventy", "Eighty", "Ninety"]
-        
-        if num < 20:
-            return ones[num]
-        elif num < 100:
-            return tens[num // 10] + ("-" + ones[num % 10] if num % 10 != 0 else "")
-        else:
-            result = ones[num // 100] + " Hundred"
-            remainder = num % 100
-            if remainder > 0:
-                result += " " + self._convert_hundreds(remainder)
-            return result
+        if 0 <= num < 1000:
+            return _HUNDREDS_WORDS[num]
+        return _spell_hundreds(num)
 
 
 # ============================================================================
 # NUMBER HANDLING
 # ============================================================================
 
+# Earlier patterns take precedence over later ones where their matches overlap
+_NUMBER_PATTERNS = [
+    re.compile(r"\b\d+(?:\.\d+)?%"),
+    re.compile(r"\b\d{1,3}(?:,\d{3})+(?!\s*(?:AD|BC|CE|BCE))\b"),
+    re.compile(r"(?<!\d\.)\b\d+\.\d+(?![\.\d])\b"),
+    re.compile(r"\b\d+(?:\.\d+)?\s+(?:people|persons?|shares?|units?|times?|fold|percent|percentage|items?|pieces?|copies?)\b", re.IGNORECASE),
+    re.compile(r"(?<![\d\-\.])\b(?!(?:19|20)\d{2}\b)(?!\d{1,4}\s+(?:Street|Road|Avenue|Drive|Lane|Boulevard|St|Rd|Ave|Dr|Ln|Blvd))\d{2,6}(?![\d\-\.])\b"),
+    re.compile(r"\b\d+:\d+\b"),
+    re.compile(r"\b\d+/\d+\b")
+]
+
+# Years, dates, phone numbers, postcodes and reference numbers in one alternation:
+# it finds a match wherever any of them would, so one search covers all five.
+# The lookahead lists every character an alternative can start with, which lets
+# the engine skip ahead instead of trying all five at each position
+_NUMBER_EXCLUSION_PATTERN = re.compile(
+    r"(?=[\d+(A-Zcrn])(?:"
+    r"\b(?:19|20)\d{2}(?:\s*[-–]\s*(?:19|20)\d{2})?\b"
+    r"|\b\d{1,2}[\.\/\-]\d{1,2}[\.\/\-](?:\d{2}|\d{4})\b"
+    r"|[\+\(]?\d{1,4}[\)\s\-]?\d{3,4}[\s\-]?\d{3,4}"
+    r"|\b\d{5,6}\b|\b[A-Z]{1,2}\d{1,2}[A-Z]?\s?\d[A-Z]{2}\b"
+    r"|(?i:case|ref|no|number)[\.\s]*\d+)"
+)
+
+_DURATION_WORD_PATTERN = re.compile(r'\b(?:years?|months?|weeks?|days?|hours?|minutes?|seconds?)\b', re.IGNORECASE)
+_DIGITS_PATTERN = re.compile(r'\d+')
+_NUMBER_WITH_UNIT_PATTERN = re.compile(r'(\d+(?:\.\d+)?)\s+(\w+)')
+# Units whose randomized values keep one decimal place
+_FRACTIONAL_UNITS = frozenset({'years', 'months', 'weeks', 'hours'})
+
+
 class NumberExtractor(EntityExtractor):
     """Extracts standalone numbers, percentages, and quantities"""
     
     def __init__(self):
-        self.number_patterns = [
-            re.compile(r"\b\d+(?:\.\d+)?%", re.IGNORECASE),
-            re.compile(r"\b\d{1,3}(?:,\d{3})+(?!\s*(?:AD|BC|CE|BCE))\b"),
-            re.compile(r"(?<!\d\.)\b\d+\.\d+(?![\.\d])\b"),
-            re.compile(r"\b\d+(?:\.\d+)?\s+(?:people|persons?|shares?|units?|times?|fold|percent|percentage|items?|pieces?|copies?)\b", re.IGNORECASE),
-            re.compile(r"(?<![\d\-\.])\b(?!(?:19|20)\d{2}\b)(?!\d{1,4}\s+(?:Street|Road|Avenue|Drive|Lane|Boulevard|St|Rd|Ave|Dr|Ln|Blvd))\d{2,6}(?![\d\-\.])\b"),
-            re.compile(r"\b\d+:\d+\b"),
-            re.compile(r"\b\d+/\d+\b")
-        ]
-        
-        self.exclusion_patterns = [
-            re.compile(r"\b(?:19|20)\d{2}(?:\s*[-–]\s*(?:19|20)\d{2})?\b"),
-            re.compile(r"\b\d{1,2}[\.\/\-]\d{1,2}[\.\/\-](?:\d{2}|\d{4})\b"),
-            re.compile(r"[\+\(]?\d{1,4}[\)\s\-]?\d{3,4}[\s\-]?\d{3,4}"),
-            re.compile(r"\b\d{5,6}\b|\b[A-Z]{1,2}\d{1,2}[A-Z]?\s?\d[A-Z]{2}\b"),
-            re.compile(r"(?:case|ref|no|number)[\.\s]*\d+", re.IGNORECASE)
-        ]
+        self.number_patterns = _NUMBER_PATTERNS
+        self.exclusion_pattern = _NUMBER_EXCLUSION_PATTERN
 
     @property
     def entity_types(self) -> List[str]:
@@ -631,51 +760,45 @@ class NumberExtractor(EntityExtractor):
 
     def extract(self, text: str) -> List[Entity]:
         entities = []
+        spans = SpanIndex()
         
         for pattern in self.number_patterns:
             for match in pattern.finditer(text):
                 number_text = match.group(0).strip()
-                start_pos = match.start()
-                end_pos = match.end()
+                start_pos, end_pos = match.span()
                 
                 if (not self._should_exclude(text, start_pos, end_pos)
-                    and not self._overlaps_existing(start_pos, end_pos, entities)
+                    and not spans.overlaps(start_pos, end_pos)
                     and self._is_valid_number(number_text)):
                     
-                    entities.append(Entity(
+                    index = spans.add(start_pos, end_pos)
+                    entities.insert(index, Entity(
                         start=start_pos,
                         end=end_pos,
                         label="NUMBER",
                         text=number_text
                     ))
         
-        return sorted(entities, key=lambda x: x.start)
+        return entities
 
     def _should_exclude(self, text: str, start: int, end: int) -> bool:
         context_start = max(0, start - 20)
         context_end = min(len(text), end + 20)
         context = text[context_start:context_end]
         
-        for pattern in self.exclusion_patterns:
-            if pattern.search(context):
-                return True
-        
-        return False
+        return self.exclusion_pattern.search(context) is not None
 
     def _is_valid_number(self, text: str) -> bool:
-        if re.search(r'\b(?:years?|months?|weeks?|days?|hours?|minutes?|seconds?)\b', text, re.IGNORECASE):
+        if _DURATION_WORD_PATTERN.search(text):
             return False
         
-        if not re.search(r'\d', text):
+        # Every number pattern starts with a digit, so an anchored match finds
+        # the leading integer and doubles as the "contains a digit" check
+        number_match = _DIGITS_PATTERN.match(text)
+        if not number_match:
             return False
         
-        number_match = re.search(r'\d+', text)
-        if number_match:
-            number_value = int(number_match.group(0))
-            if number_value > 1_000_000:
-                return False
-        
-        return True
+        return int(number_match.group(0)) <= 1_000_000
 
 
 class NumberPseudonymizer(EntityPseudonymizer):
@@ -693,7 +816,8 @@ class NumberPseudonymizer(EntityPseudonymizer):
         if '/' in text:
             return self._handle_fraction(text)
         
-        unit_match = re.search(r'(\d+(?:\.\d+)?)\s+(\w+)', text)
+        # Plain str checks are cheaper than a regex dispatch here; only the unit form needs one
+        unit_match = _NUMBER_WITH_UNIT_PATTERN.search(text)
         if unit_match:
             return self._handle_number_with_unit(unit_match.group(1), unit_match.group(2))
         
@@ -712,7 +836,7 @@ class NumberPseudonymizer(EntityPseudonymizer):
             new_value = NumberRandomizer.randomize_number(original_value, preserve_small=False)
             
             if '.' in number_str:
-                decimal_places = len(number_str.split('.')[1])
+                decimal_places = len(number_str.partition('.')[2])
                 return f"{new_value:.{decimal_places}f}%"
             else:
                 return f"{int(round(new_value))}%"
@@ -750,7 +874,7 @@ class NumberPseudonymizer(EntityPseudonymizer):
             original_value = float(number_str)
             new_value = NumberRandomizer.randomize_number(original_value, preserve_small=False)
             
-            if unit.lower() in ['years', 'months', 'weeks', 'hours']:
+            if unit.lower() in _FRACTIONAL_UNITS:
                 return f"{new_value:.1f} {unit}"
             else:
                 return f"{int(round(new_value))} {unit}"
@@ -758,10 +882,14 @@ class NumberPseudonymizer(EntityPseudonymizer):
             return f"{number_str} {unit}"
 
     def _handle_comma_number(self, text: str) -> str:
+        number_str = text.replace(',', '')
         try:
-            number_value = float(text.replace(',', ''))
-            new_value = NumberRandomizer.randomize_number(number_value, preserve_small=False)
-            return f"{int(round(new_value)):,}"
+            # Extracted comma numbers are whole digit groups; keep them on the int path
+            if '.' in number_str:
+                new_value = int(round(NumberRandomizer.randomize_number(float(number_str), preserve_small=False)))
+            else:
+                new_value = NumberRandomizer.randomize_int(int(number_str), preserve_small=False)
+            return f"{new_value:,}"
         except ValueError:
             return text
 
@@ -770,16 +898,14 @@ class NumberPseudonymizer(EntityPseudonymizer):
             original_value = float(text)
             new_value = NumberRandomizer.randomize_number(original_value, preserve_small=False)
             
-            decimal_places = len(text.split('.')[1])
+            decimal_places = len(text.partition('.')[2])
             return f"{new_value:.{decimal_places}f}"
         except ValueError:
             return text
 
     def _handle_integer(self, text: str) -> str:
         try:
-            original_value = int(text)
-            new_value = NumberRandomizer.randomize_number(float(original_value), preserve_small=True)
-            return str(int(round(new_value)))
+            return str(NumberRandomizer.randomize_int(int(text), preserve_small=True))
         except ValueError:
             return text
 
@@ -788,17 +914,24 @@ class NumberPseudonymizer(EntityPseudonymizer):
 # ADDRESS HANDLING
 # ============================================================================
 
+_ADDRESS_PATTERNS = [
+    re.compile(r"\b\d+\s+[A-Z][a-z]+\s+(?:Street|Road|Avenue|Drive|Lane|Boulevard|Quay),\s*Singapore\s+\d{6}\b"),
+    re.compile(r"\b(?:One|Two|Three|Four|Five|\d+)\s+[A-Z][a-z]*\s+(?:Quay|Plaza|Square|Tower|Building|Centre|Center)(?:,\s*Level\s*\d+)?(?:,\s*\d+\s+[A-Z][a-z]*\s+(?:Street|Road|Quay))?(?:,\s*Singapore\s+\d{6})?\b"),
+    re.compile(r"\b\d+\s+[A-Z][a-z]+\s+(?:Street|Road|Avenue|Drive|Lane|Boulevard),\s*[A-Z][a-z]+,\s*[A-Z]{2}\s+\d{5}\b"),
+    re.compile(r"\b\d+\s+[A-Z][a-z]+\s+(?:Street|St|Road|Rd|Avenue|Ave|Drive|Dr|Lane|Ln|Boulevard|Blvd|Walk|Close|Crescent|Place|Park|Gardens|Heights|View|Terrace|Rise|Hill|Grove|Way|Circuit|Centre|Center|Quay)\b"),
+    re.compile(r"\b(?:One|Two|Three|Four|Five|Six|Seven|Eight|Nine|Ten)\s+[A-Z][a-z]*\s+(?:Street|Road|Avenue|Quay|Boulevard|Plaza|Square|Tower|Building|Centre|Center)\b")
+]
+
+# Every address pattern starts with a number or number word followed by a capitalised
+# word, so text without this pair cannot contain an address
+_ADDRESS_PREFILTER = re.compile(r"(?:\d|One|Two|Three|Four|Five|Six|Seven|Eight|Nine|Ten)\s+[A-Z]")
+
+
 class AddressExtractor(EntityExtractor):
     """Extracts address patterns including Singapore-specific formats"""
     
     def __init__(self):
-        self.address_patterns = [
-            re.compile(r"\b\d+\s+[A-Z][a-z]+\s+(?:Street|Road|Avenue|Drive|Lane|Boulevard|Quay),\s*Singapore\s+\d{6}\b"),
-            re.compile(r"\b(?:One|Two|Three|Four|Five|\d+)\s+[A-Z][a-z]*\s+(?:Quay|Plaza|Square|Tower|Building|Centre|Center)(?:,\s*Level\s*\d+)?(?:,\s*\d+\s+[A-Z][a-z]*\s+(?:Street|Road|Quay))?(?:,\s*Singapore\s+\d{6})?\b"),
-            re.compile(r"\b\d+\s+[A-Z][a-z]+\s+(?:Street|Road|Avenue|Drive|Lane|Boulevard),\s*[A-Z][a-z]+,\s*[A-Z]{2}\s+\d{5}\b"),
-            re.compile(r"\b\d+\s+[A-Z][a-z]+\s+(?:Street|St|Road|Rd|Avenue|Ave|Drive|Dr|Lane|Ln|Boulevard|Blvd|Walk|Close|Crescent|Place|Park|Gardens|Heights|View|Terrace|Rise|Hill|Grove|Way|Circuit|Centre|Center|Quay)\b"),
-            re.compile(r"\b(?:One|Two|Three|Four|Five|Six|Seven|Eight|Nine|Ten)\s+[A-Z][a-z]*\s+(?:Street|Road|Avenue|Quay|Boulevard|Plaza|Square|Tower|Building|Centre|Center)\b")
-        ]
+        self.address_patterns = _ADDRESS_PATTERNS
     
     @property
     def entity_types(self) -> List[str]:
@@ -806,18 +939,61 @@ class AddressExtractor(EntityExtractor):
     
     def extract(self, text: str) -> List[Entity]:
         entities = []
+        if not _ADDRESS_PREFILTER.search(text):
+            return entities
+        
+        spans = SpanIndex()
         
         for pattern in self.address_patterns:
             for match in pattern.finditer(text):
-                if not self._overlaps_existing(match.start(), match.end(), entities):
-                    entities.append(Entity(
-                        start=match.start(),
-                        end=match.end(),
+                start_pos, end_pos = match.span()
+                if not spans.overlaps(start_pos, end_pos):
+                    index = spans.add(start_pos, end_pos)
+                    entities.insert(index, Entity(
+                        start=start_pos,
+                        end=end_pos,
                         label="ADDRESS",
                         text=match.group(0)
                     ))
         
-        return sorted(entities, key=lambda x: x.start)
+        return entities
+
+
+# Cached like _hash_letter, as is the normalization below
+@lru_cache(maxsize=4096)
+def _address_code(salt: str, normalized_address: str) -> str:
+    hash_input = f"{salt}:{normalized_address}".encode('utf-8')
+    digest = hashlib.sha256(hash_input).digest()
+    
+    # The first three digest bytes, i.e. the first six hex digits
+    return str(int.from_bytes(digest[:3], 'big') % 1000000).zfill(6)
+
+
+_WHITESPACE_RUN_PATTERN = re.compile(r'\s+')
+
+# Applied in sequence, so abbreviations are expanded only where spaces surround them
+# before punctuation is dropped (e.g. "st," stays as is)
+_ADDRESS_REPLACEMENTS = (
+    (' st ', ' street '),
+    (' rd ', ' road '),
+    (' ave ', ' avenue '),
+    (' dr ', ' drive '),
+    (' ln ', ' lane '),
+    (' blvd ', ' boulevard '),
+    ('centre', 'center'),
+    (',', ''),
+    ('.', '')
+)
+
+
+@lru_cache(maxsize=4096)
+def _normalize_address_text(address: str) -> str:
+    normalized = _WHITESPACE_RUN_PATTERN.sub(' ', address.lower().strip())
+    
+    for old, new in _ADDRESS_REPLACEMENTS:
+        normalized = normalized.replace(old, new)
+    
+    return normalized.strip()
 
 
 class AddressPseudonymizer(EntityPseudonymizer):
@@ -829,35 +1005,10 @@ class AddressPseudonymizer(EntityPseudonymizer):
     
     def pseudonymize(self, original_text: str, entity_label: str) -> str:
         normalized_address = self._normalize_address(original_text)
-        
-        hash_input = f"{self.salt}:{normalized_address}".encode('utf-8')
-        hash_object = hashlib.sha256(hash_input)
-        hash_hex = hash_object.hexdigest()
-        
-        hex_substring = hash_hex[:6]
-        address_code = str(int(hex_substring, 16) % 1000000).zfill(6)
-        
-        return f"[ADDRESS {address_code}]"
+        return f"[ADDRESS {_address_code(self.salt, normalized_address)}]"
     
     def _normalize_address(self, address: str) -> str:
-        normalized = re.sub(r'\s+', ' ', address.lower().strip())
-        
-        replacements = {
-            ' st ': ' street ',
-            ' rd ': ' road ',
-            ' ave ': ' avenue ',
-            ' dr ': ' drive ',
-            ' ln ': ' lane ',
-            ' blvd ': ' boulevard ',
-            'centre': 'center',
-            ',': '',
-            '.': ''
-        }
-        
-        for old, new in replacements.items():
-            normalized = normalized.replace(old, new)
-        
-        return normalized.strip()
+        return _normalize_address_text(address)
 
 
 # ============================================================================
@@ -872,32 +1023,97 @@ class PersonEntity(Entity):
     organization: Optional[str] = None
 
 
+_LEGAL_ROLES = frozenset({
+    'plaintiff', 'defendant', 'complainant', 'respondent', 'petitioner', 
+    'appellant', 'appellee', 'cross-defendant', 'third-party defendant',
+    'intervenor', 'amicus', 'witness', 'expert witness',
+    'grantor', 'grantee', 'licensor', 'licensee', 'buyer', 'seller',
+    'vendor', 'purchaser', 'contractor', 'subcontractor', 'guarantor',
+    'borrower', 'lender', 'mortgagor', 'mortgagee', 'lessor', 'lessee',
+    'trustee', 'beneficiary', 'settlor', 'executor', 'administrator',
+    'ceo', 'cfo', 'coo', 'president', 'chairman', 'director', 'officer',
+    'manager', 'partner', 'shareholder', 'stockholder', 'member',
+    'managing director', 'general counsel', 'secretary', 'treasurer',
+    'attorney', 'lawyer', 'counsel', 'advocate', 'barrister', 'solicitor',
+    'judge', 'magistrate', 'arbitrator', 'mediator', 'paralegal',
+    'legal assistant', 'court reporter', 'clerk',
+    'guardian', 'conservator', 'agent', 'representative', 'proxy',
+    'assignor', 'assignee', 'successor', 'heir', 'beneficiary'
+})
+
+_PROFESSIONAL_TITLES = frozenset({
+    'mr', 'mrs', 'ms', 'miss', 'dr', 'prof', 'professor', 'hon',
+    'honorable', 'justice', 'chief justice', 'associate justice'
+})
+
+_ROLE_ABBREVIATIONS = {
+    'atty': 'attorney',
+    'mgr': 'manager',
+    'mgmt': 'management',
+    'chmn': 'chairman',
+    'chrmn': 'chairman',
+    'pres': 'president',
+    'v.p.': 'vice president',
+    'vp': 'vice president'
+}
+
+# Role as it appears in a pseudonym; any other role becomes 'Person'
+_ROLE_PSEUDONYM_NAMES = {
+    'plaintiff': 'Plaintiff',
+    'defendant': 'Defendant', 
+    'attorney': 'Attorney',
+    'lawyer': 'Counsel',
+    'counsel': 'Counsel',
+    'partner': 'Partner',
+    'ceo': 'CEO',
+    'president': 'President',
+    'director': 'Director',
+    'judge': 'Judge',
+    'witness': 'Witness',
+    'buyer': 'Buyer',
+    'seller': 'Seller',
+    'grantor': 'Grantor',
+    'grantee': 'Grantee',
+    'trustee': 'Trustee'
+}
+
+# Name at the start of an entity, up to the first comma or parenthesis
+_BARE_NAME_PATTERN = re.compile(r'^([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*?)(?:,|\s+\()')
+_LEADING_NAME_PATTERN = re.compile(r'^([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)')
+_LEADING_FULL_NAME_PATTERN = re.compile(r'^([A-Z][a-z]+(?:\s+[A-Z][a-z]+)+)')
+_FULL_NAME_PATTERN = re.compile(r'^[A-Z][a-z]+(?:\s+[A-Z][a-z]+)+$')
+_ROLE_NAME_PATTERN = re.compile(r'\b(?:plaintiff|defendant|attorney|dr\.?|mr\.?|mrs\.?|ms\.?)\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)', re.IGNORECASE)
+_TITLED_NAME_PATTERN = re.compile(r'^(?:Attorney|Counsel|Dr|Mr|Mrs|Ms)\.?\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)+)', re.IGNORECASE)
+
+_ROLE_SEPARATOR_PATTERN = re.compile(r'\s+and\s+|,\s*')
+_LEADING_ARTICLE_PATTERN = re.compile(r'^(the\s+|a\s+|an\s+)')
+_TRAILING_THEREOF_PATTERN = re.compile(r'\s+(thereof|therein)$')
+
+# "Name (Role)" and "Name, Role", tried in order
+_PERSON_INFO_PATTERNS = [
+    re.compile(r'([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\s*\(\s*([^)]+)\s*\)'),
+    re.compile(r'([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*),\s+([^,]+)')
+]
+
+# Substrings that mark a candidate as a company rather than a person
+_NAME_COMPANY_INDICATOR_PATTERN = re.compile(r'ltd|llc|llp|inc|corp|company|holdings|bank')
+_PERSON_COMPANY_INDICATOR_PATTERN = re.compile(r'inc|corp|llc|llp|company|co\.')
+_NON_PERSON_STARTS = (
+    'the plaintiff initiated', 'the defendant filed', 'the settlement',
+    'the hearing', 'the trial', 'the case', 'the matter', 'the suit',
+    'the dispute', 'the claim', 'the lawsuit', 'the action', 'the proceeding',
+)
+
+_STRUCTURED_ENTITY_PATTERN = re.compile(r'^(.+?),\s+(.+?)\s+of\s+(.+?)\s+\("(.+?)"\)$', re.IGNORECASE)
+_QUOTED_ROLE_PATTERN = re.compile(r'^(.+?)\s+\("(.+?)"\)$', re.IGNORECASE)
+
+
 class LegalPersonExtractor(EntityExtractor):
     """Extracts persons with explicit legal roles"""
     
     def __init__(self):
-        self.legal_roles = {
-            'plaintiff', 'defendant', 'complainant', 'respondent', 'petitioner', 
-            'appellant', 'appellee', 'cross-defendant', 'third-party defendant',
-            'intervenor', 'amicus', 'witness', 'expert witness',
-            'grantor', 'grantee', 'licensor', 'licensee', 'buyer', 'seller',
-            'vendor', 'purchaser', 'contractor', 'subcontractor', 'guarantor',
-            'borrower', 'lender', 'mortgagor', 'mortgagee', 'lessor', 'lessee',
-            'trustee', 'beneficiary', 'settlor', 'executor', 'administrator',
-            'ceo', 'cfo', 'coo', 'president', 'chairman', 'director', 'officer',
-            'manager', 'partner', 'shareholder', 'stockholder', 'member',
-            'managing director', 'general counsel', 'secretary', 'treasurer',
-            'attorney', 'lawyer', 'counsel', 'advocate', 'barrister', 'solicitor',
-            'judge', 'magistrate', 'arbitrator', 'mediator', 'paralegal',
-            'legal assistant', 'court reporter', 'clerk',
-            'guardian', 'conservator', 'agent', 'representative', 'proxy',
-            'assignor', 'assignee', 'successor', 'heir', 'beneficiary'
-        }
-        
-        self.professional_titles = {
-            'mr', 'mrs', 'ms', 'miss', 'dr', 'prof', 'professor', 'hon',
-            'honorable', 'justice', 'chief justice', 'associate justice'
-        }
+        self.legal_roles = _LEGAL_ROLES
+        self.professional_titles = _PROFESSIONAL_TITLES
         
         self.role_priority = {
             'plaintiff': 100, 'defendant': 100,
@@ -913,13 +1129,19 @@ class LegalPersonExtractor(EntityExtractor):
         
         roles_pattern = '|'.join(re.escape(role) for role in sorted_roles)
         titles_pattern = '|'.join(re.escape(title) for title in sorted_titles)
+        # Finds any role inside a candidate in one C-level scan instead of one test per role
+        self.role_substring_pattern = re.compile(roles_pattern)
+        # Lets the role pattern reject most word starts before trying every role
+        role_initials = '[' + ''.join(sorted({re.escape(role[0]) for role in self.legal_roles})) + ']'
         
+        # Any match of the first pattern that starts mid-word would already have matched from
+        # the start of that word, so (?<![a-z]) only stops the scan retrying every letter
         self.role_patterns = [
-            re.compile(r'(?:between\s+)?([A-Z][a-z]+(?:\s+[A-Z][a-z]+){0,2}),\s+([A-Za-z\s]+)\s+of\s+([A-Z][A-Za-z\s&]+?)\s+Ltd\s*\("?([^)"]+)"?\)', re.IGNORECASE),
+            re.compile(r'(?:between\s+|(?<![a-z]))([A-Z][a-z]+(?:\s+[A-Z][a-z]+){0,2}),\s+([A-Za-z\s]+)\s+of\s+([A-Z][A-Za-z\s&]+?)\s+Ltd\s*\("?([^)"]+)"?\)', re.IGNORECASE),
             re.compile(r'(?:,|and)\s+([A-Z][a-z]+\s+[A-Z][a-z]+)\s*\(["""]([^)"""]+)["""]\)', re.IGNORECASE),
             re.compile(r'\b([A-Z][a-z]+(?:\s+[A-Z][a-z]+){0,2})\s*\(\s*([^)]+)\s*\)', re.IGNORECASE),
             re.compile(r'\b([A-Z][a-z]+(?:\s+[A-Z][a-z]+){0,2}),\s+([A-Za-z\s]{2,30})(?=\s*\(|,|\.|$)', re.IGNORECASE),
-            re.compile(r'\b(' + roles_pattern + r')\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)(?=\s+[a-z(]|\s*[.,(;:]|\s*$)', re.IGNORECASE),
+            re.compile(r'\b(?=' + role_initials + r')(' + roles_pattern + r')\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)(?=\s+[a-z(]|\s*[.,(;:]|\s*$)', re.IGNORECASE),
             re.compile(r'\b([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*),\s+the\s+([a-zA-Z\s]+?)(?:,|\.|$)', re.IGNORECASE),
             re.compile(r'\b(' + titles_pattern + r')\.?\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)', re.IGNORECASE),
             re.compile(r'\b([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\s+as\s+([a-zA-Z\s]+?)(?:,|\.|$|\s+of)', re.IGNORECASE),
@@ -935,6 +1157,7 @@ class LegalPersonExtractor(EntityExtractor):
         text = text.replace('""', '"')
         text = text.replace("''", "'")
         entities = []
+        spans = SpanIndex()
         seen_names = {}
         
         for i, pattern in enumerate(self.role_patterns):
@@ -942,8 +1165,9 @@ class LegalPersonExtractor(EntityExtractor):
                 person_entity = self._process_role_match(match, i)
                 
                 if person_entity and self._is_valid_person_entity(person_entity):
-                    if not self._overlaps_existing(person_entity.start, person_entity.end, entities):
-                        entities.append(person_entity)
+                    if not spans.overlaps(person_entity.start, person_entity.end):
+                        index = spans.add(person_entity.start, person_entity.end)
+                        entities.insert(index, person_entity)
                         
                         bare_name = self._extract_name_from_entity_text(person_entity.text)
                         if bare_name and person_entity.role:
@@ -957,10 +1181,12 @@ class LegalPersonExtractor(EntityExtractor):
                 name_pattern = re.compile(pattern_str, re.IGNORECASE)
                 
                 for match in name_pattern.finditer(text):
-                    if not self._overlaps_existing(match.start(), match.end(), entities):
-                        entities.append(PersonEntity(
-                            start=match.start(),
-                            end=match.end(),
+                    start_pos, end_pos = match.span()
+                    if not spans.overlaps(start_pos, end_pos):
+                        index = spans.add(start_pos, end_pos)
+                        entities.insert(index, PersonEntity(
+                            start=start_pos,
+                            end=end_pos,
                             label="LEGAL_PERSON",
                             text=match.group(0),
                             role=role
@@ -968,16 +1194,18 @@ class LegalPersonExtractor(EntityExtractor):
             elif len(name_words) == 1:
                 name_pattern = re.compile(r'\b' + re.escape(name) + r'\b', re.IGNORECASE)
                 for match in name_pattern.finditer(text):
-                    if not self._overlaps_existing(match.start(), match.end(), entities):
-                        entities.append(PersonEntity(
-                            start=match.start(),
-                            end=match.end(),
+                    start_pos, end_pos = match.span()
+                    if not spans.overlaps(start_pos, end_pos):
+                        index = spans.add(start_pos, end_pos)
+                        entities.insert(index, PersonEntity(
+                            start=start_pos,
+                            end=end_pos,
                             label="LEGAL_PERSON",
                             text=match.group(0),
                             role=role
                         ))
         
-        return sorted(entities, key=lambda x: x.start)
+        return entities
     
     def _process_role_match(self, match: re.Match, pattern_index: int) -> Optional[PersonEntity]:
         groups = match.groups()
@@ -1027,7 +1255,7 @@ class LegalPersonExtractor(EntityExtractor):
             role_candidate = groups[1].strip()
             
             if ' and ' in role_candidate or ',' in role_candidate:
-                roles = re.split(r'\s+and\s+|,\s*', role_candidate)
+                roles = _ROLE_SEPARATOR_PATTERN.split(role_candidate)
                 roles = [r.strip() for r in roles if self._looks_like_role(r)]
                 
                 if roles:
@@ -1066,15 +1294,15 @@ class LegalPersonExtractor(EntityExtractor):
         return None
     
     def _extract_name_from_entity_text(self, entity_text: str) -> Optional[str]:
-        match = re.match(r'^([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*?)(?:,|\s+\()', entity_text)
+        match = _BARE_NAME_PATTERN.match(entity_text)
         if match:
             return match.group(1).strip()
         
-        match = re.match(r'^([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)', entity_text)
+        match = _LEADING_NAME_PATTERN.match(entity_text)
         if match:
             return match.group(1).strip()
         
-        role_name_match = re.search(r'\b(?:plaintiff|defendant|attorney|dr\.?|mr\.?|mrs\.?|ms\.?)\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)', entity_text, re.IGNORECASE)
+        role_name_match = _ROLE_NAME_PATTERN.search(entity_text)
         if role_name_match:
             return role_name_match.group(1).strip()
         
@@ -1089,57 +1317,37 @@ class LegalPersonExtractor(EntityExtractor):
         if len(words) < 1 or len(words) > 4:
             return False
         
-        company_indicators = ['ltd', 'llc', 'llp', 'inc', 'corp', 'company', 'holdings', 'bank']
-        text_lower = text.lower()
-        if any(indicator in text_lower for indicator in company_indicators):
+        if _NAME_COMPANY_INDICATOR_PATTERN.search(text.lower()):
             return False
         
         return all(word[0].isupper() and word[1:].islower() for word in words if word.isalpha())
     
     def _looks_like_role(self, text: str) -> bool:
         text_lower = text.lower().strip()
-        text_clean = re.sub(r'^(the\s+|a\s+|an\s+)', '', text_lower)
-        text_clean = re.sub(r'\s+(thereof|therein)$', '', text_clean)
+        text_clean = _LEADING_ARTICLE_PATTERN.sub('', text_lower)
+        text_clean = _TRAILING_THEREOF_PATTERN.sub('', text_clean)
         
         return (text_clean in self.legal_roles or 
                 text_clean in self.professional_titles or
-                any(role in text_clean for role in self.legal_roles))
+                self.role_substring_pattern.search(text_clean) is not None)
     
     def _normalize_role(self, role: str) -> str:
         role_lower = role.lower().strip()
-        role_clean = re.sub(r'^(the\s+|a\s+|an\s+)', '', role_lower)
-        
-        role_mappings = {
-            'atty': 'attorney',
-            'mgr': 'manager',
-            'mgmt': 'management',
-            'chmn': 'chairman',
-            'chrmn': 'chairman',
-            'pres': 'president',
-            'v.p.': 'vice president',
-            'vp': 'vice president'
-        }
+        role_clean = _LEADING_ARTICLE_PATTERN.sub('', role_lower)
         
-        return role_mappings.get(role_clean, role_clean)
+        return _ROLE_ABBREVIATIONS.get(role_clean, role_clean)
     
     def _is_valid_person_entity(self, entity: PersonEntity) -> bool:
         if len(entity.text) < 3 or len(entity.text) > 150:
             return False
         
         main_text = entity.text.split('(')[0].strip()
-        company_indicators = ['inc', 'corp', 'llc', 'llp', 'company', 'co.']
         main_text_lower = main_text.lower()
         
-        if any(indicator in main_text_lower for indicator in company_indicators):
+        if _PERSON_COMPANY_INDICATOR_PATTERN.search(main_text_lower):
             return False
         
-        non_person_starts = [
-            'the plaintiff initiated', 'the defendant filed', 'the settlement',
-            'the hearing', 'the trial', 'the case', 'the matter', 'the suit',
-            'the dispute', 'the claim', 'the lawsuit', 'the action', 'the proceeding',
-        ]
-        
-        if any(main_text_lower.startswith(pattern) for pattern in non_person_starts):
+        if main_text_lower.startswith(_NON_PERSON_STARTS):
             return False
         
         words = main_text.split()
@@ -1187,19 +1395,19 @@ class LegalPersonPseudonymizer(EntityPseudonymizer):
                 self.replacement_cache[entity.text] = replacement
     
     def _extract_bare_name(self, entity_text: str) -> Optional[str]:
-        match = re.match(r'^([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*?)(?:,|\s+\()', entity_text)
+        match = _BARE_NAME_PATTERN.match(entity_text)
         if match:
             return match.group(1).strip()
         
-        match = re.match(r'^([A-Z][a-z]+(?:\s+[A-Z][a-z]+)+)', entity_text)
+        match = _LEADING_FULL_NAME_PATTERN.match(entity_text)
         if match:
             return match.group(1).strip()
         
-        match = re.match(r'^(?:Attorney|Counsel|Dr|Mr|Mrs|Ms)\.?\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)+)', entity_text, re.IGNORECASE)
+        match = _TITLED_NAME_PATTERN.match(entity_text)
         if match:
             return match.group(1).strip()
         
-        if re.match(r'^[A-Z][a-z]+(?:\s+[A-Z][a-z]+)+$', entity_text):
+        if _FULL_NAME_PATTERN.match(entity_text):
             return entity_text.strip()
         
         return None
@@ -1261,13 +1469,8 @@ class LegalPersonPseudonymizer(EntityPseudonymizer):
         return self.replacement_cache[original_text]
     
     def _parse_person_info(self, text: str) -> Dict[str, Optional[str]]:
-        patterns = [
-            r'([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\s*\(\s*([^)]+)\s*\)',
-            r'([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*),\s+([^,]+)'
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, text)
+        for pattern in _PERSON_INFO_PATTERNS:
+            match = pattern.search(text)
             if match:
                 return {'name': match.group(1), 'role': match.group(2).strip()}
         
@@ -1297,13 +1500,7 @@ class LegalPersonPseudonymizer(EntityPseudonymizer):
         role_normalized = self._normalize_role_for_pseudonym(role)
         name_normalized = name.lower().strip()
         
-        hash_input = f"{self.hash_salt}:{name_normalized}:{role_normalized}".encode('utf-8')
-        hash_object = hashlib.sha256(hash_input)
-        hash_hex = hash_object.hexdigest()
-        
-        letter_index = int(hash_hex[:2], 16) % 26
-        letter = chr(ord('A') + letter_index)
-        
+        letter = _hash_letter(f"{self.hash_salt}:{name_normalized}:{role_normalized}")
         return f"{role_normalized} {letter}"
     
     def _generate_counter_based_pseudonym(self, role: str) -> str:
@@ -1318,35 +1515,13 @@ class LegalPersonPseudonymizer(EntityPseudonymizer):
         return f"{role_normalized} {letter}"
     
     def _normalize_role_for_pseudonym(self, role: str) -> str:
-        role_clean = role.lower().strip()
-        
-        role_mappings = {
-            'plaintiff': 'Plaintiff',
-            'defendant': 'Defendant', 
-            'attorney': 'Attorney',
-            'lawyer': 'Counsel',
-            'counsel': 'Counsel',
-            'partner': 'Partner',
-            'ceo': 'CEO',
-            'president': 'President',
-            'director': 'Director',
-            'judge': 'Judge',
-            'witness': 'Witness',
-            'buyer': 'Buyer',
-            'seller': 'Seller',
-            'grantor': 'Grantor',
-            'grantee': 'Grantee',
-            'trustee': 'Trustee'
-        }
-        
-        return role_mappings.get(role_clean, 'Person')
+        return _ROLE_PSEUDONYM_NAMES.get(role.lower().strip(), 'Person')
     
     def _generate_generic_pseudonym(self) -> str:
         return self._generate_counter_based_pseudonym('person')
 
     def _reconstruct_structured_entity(self, original_text: str, base_pseudonym: str, all_replacements: dict) -> str:
-        pattern1 = r'^(.+?),\s+(.+?)\s+of\s+(.+?)\s+\("(.+?)"\)$'
-        match = re.match(pattern1, original_text, re.IGNORECASE)
+        match = _STRUCTURED_ENTITY_PATTERN.match(original_text)
         
         if match:
             title = match.group(2).strip()
@@ -1357,8 +1532,7 @@ class LegalPersonPseudonymizer(EntityPseudonymizer):
             
             return f'{base_pseudonym}, {title} of {org_pseudo} ("{role}")'
         
-        pattern2 = r'^(.+?)\s+\("(.+?)"\)$'
-        match = re.match(pattern2, original_text, re.IGNORECASE)
+        match = _QUOTED_ROLE_PATTERN.match(original_text)
         
         if match:
             role = match.group(2).strip()
@@ -1392,15 +1566,27 @@ class LegalPersonPseudonymizer(EntityPseudonymizer):
 # SPACY-BASED EXTRACTION
 # ============================================================================
 
+_RELATIVE_DATE_PATTERN = re.compile(r"\b(?:no\s+later\s+than|before|after|during|within)\b", re.IGNORECASE)
+_DATE_TOKEN_PATTERN = re.compile(
+    r"\b(?:January|February|March|April|May|June|July|August|September|October|November|December"
+    r"|Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec|\d{1,2})\b",
+    re.IGNORECASE
+)
+
+
 class SpacyExtractor(EntityExtractor):
     """Uses spaCy NER for general entity types"""
     
-    def __init__(self, nlp_model, target_labels: set):
+    def __init__(self, nlp_model, target_labels: set, batch_size: int = 64, max_chunk_chars: int = 5000):
         self.nlp = nlp_model
         self.target_labels = target_labels
+        self.batch_size = batch_size
+        self.max_chunk_chars = max_chunk_chars
         self.exclusion_words = {
             "payable", "transfer", "wire", "agreed", "sell", "having", "incorporated"
         }
+        self.relative_date_pattern = _RELATIVE_DATE_PATTERN
+        self.date_token_pattern = _DATE_TOKEN_PATTERN
     
     @property
     def entity_types(self) -> List[str]:
@@ -1408,22 +1594,57 @@ class SpacyExtractor(EntityExtractor):
     
     def extract(self, text: str) -> List[Entity]:
         entities = []
-        doc = self.nlp(text)
         
-        for ent in doc.ents:
-            if (ent.label_ in self.target_labels 
-                and len(ent.text.strip()) >= 2 
-                and not self._contains_exclusion_words(ent.text)
-                and self._is_valid_entity(ent)):
+        # Run NER per chunk in batches; offsets are shifted back to the full text
+        offsets, chunks = self._split_into_chunks(text)
+        
+        for offset, doc in zip(offsets, self.nlp.pipe(chunks, batch_size=self.batch_size)):
+            for ent in doc.ents:
+                if (ent.label_ in self.target_labels 
+                    and len(ent.text.strip()) >= 2 
+                    and not self._contains_exclusion_words(ent.text)
+                    and self._is_valid_entity(ent)):
+                    
+                    entities.append(Entity(
+                        start=offset + ent.start_char,
+                        end=offset + ent.end_char,
+                        label=ent.label_,
+                        text=ent.text
+                    ))
+        
+        # Already nearly in order (chunks and doc.ents both run left to right), which timsort handles in one pass
+        entities.sort(key=attrgetter("start"))
+        return entities
+    
+    def _split_into_chunks(self, text: str) -> Tuple[List[int], List[str]]:
+        """Split text into paragraphs, packing overlong ones into line-aligned chunks"""
+        offsets, chunks = [], []
+        paragraph_offset = 0
+        
+        for paragraph in text.split("\n\n"):
+            start = 0
+            while True:
+                end = start + self.max_chunk_chars
+                if end >= len(paragraph):
+                    end = len(paragraph)
+                else:
+                    # Prefer cutting at a line break, then at a space, so entities stay whole
+                    cut = paragraph.rfind("\n", start + 1, end)
+                    if cut <= start:
+                        cut = paragraph.rfind(" ", start + 1, end)
+                    if cut > start:
+                        end = cut
                 
-                entities.append(Entity(
-                    start=ent.start_char,
-                    end=ent.end_char,
-                    label=ent.label_,
-                    text=ent.text
-                ))
+                offsets.append(paragraph_offset + start)
+                chunks.append(paragraph[start:end])
+                
+                if end >= len(paragraph):
+                    break
+                start = end
+            
+            paragraph_offset += len(paragraph) + 2
         
-        return sorted(entities, key=lambda x: x.start)
+        return offsets, chunks
     
     def _contains_exclusion_words(self, text: str) -> bool:
         text_lower = text.lower()
@@ -1446,9 +1667,9 @@ class SpacyExtractor(EntityExtractor):
                 return False
         
         if ent.label_ == "DATE":
-            if re.search(r"\b(?:no\s+later\s+than|before|after|during|within)\b", ent.text, re.IGNORECASE):
+            if self.relative_date_pattern.search(ent.text):
                 return False
-            if not re.search(r"\b(?:January|February|March|April|May|June|July|August|September|October|November|December|Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec|\d{1,2})\b", ent.text, re.IGNORECASE):
+            if not self.date_token_pattern.search(ent.text):
                 return False
         
         return True
@@ -1470,10 +1691,7 @@ class CounterBasedPseudonymizer(EntityPseudonymizer):
     
     def pseudonymize(self, original_text: str, entity_label: str) -> str:
         if self.use_hash:
-            hash_input = f"{self.salt}:{original_text}".encode('utf-8')
-            hash_object = hashlib.sha256(hash_input)
-            letter_index = int(hash_object.hexdigest()[:2], 16) % 26
-            letter = chr(ord("A") + letter_index)
+            letter = _hash_letter(f"{self.salt}:{original_text}")
         else:
             self.counter += 1
             letter = chr(ord("A") + (self.counter - 1) % 26)
@@ -1481,6 +1699,22 @@ class CounterBasedPseudonymizer(EntityPseudonymizer):
         return f"{self.prefix} {letter}"
 
 
+_GPE_COUNTRIES = frozenset({
+    "Singapore", "Malaysia", "Thailand", "Indonesia", "Philippines", 
+    "Vietnam", "Myanmar", "Cambodia", "Laos", "Brunei",
+    "China", "Japan", "South Korea", "Taiwan", "Hong Kong", "Macau",
+    "India", "Pakistan", "Bangladesh", "Sri Lanka", "Nepal",
+    "United States", "USA", "US", "United Kingdom", "UK", "Canada",
+    "Australia", "New Zealand", "Germany", "France", "Italy", "Spain"
+})
+
+_GPE_STATES = frozenset({
+    "Delaware", "California", "New York", "Texas", "Florida",
+    "Johor", "Selangor", "Penang", "Sabah", "Sarawak",
+    "Jakarta", "West Java", "Bangkok", "Ontario", "Quebec"
+})
+
+
 class GPEPseudonymizer(EntityPseudonymizer):
     """Handles geographic/political entities with subcategories"""
     
@@ -1488,45 +1722,25 @@ class GPEPseudonymizer(EntityPseudonymizer):
         super().__init__()
         self.countries = self._load_countries()
         self.states = self._load_states()
+        # (category, prefix) per known name; countries win if a name is in both sets
+        self.categories = {state: ("STATE", "State") for state in self.states}
+        self.categories.update((country, ("COUNTRY", "Country")) for country in self.countries)
         self.counters = {"COUNTRY": 0, "STATE": 0, "CITY": 0}
         self.use_hash = use_hash
         self.salt = "gpe_pseudonyms_2024"
     
-    def _load_countries(self) -> set:
-        return {
-            "Singapore", "Malaysia", "Thailand", "Indonesia", "Philippines", 
-            "Vietnam", "Myanmar", "Cambodia", "Laos", "Brunei",
-            "China", "Japan", "South Korea", "Taiwan", "Hong Kong", "Macau",
-            "India", "Pakistan", "Bangladesh", "Sri Lanka", "Nepal",
-            "United States", "USA", "US", "United Kingdom", "UK", "Canada",
-            "Australia", "New Zealand", "Germany", "France", "Italy", "Spain"
-        }
+    def _load_countries(self) -> frozenset:
+        return _GPE_COUNTRIES
     
-    def _load_states(self) -> set:
-        return {
-            "Delaware", "California", "New York", "Texas", "Florida",
-            "Johor", "Selangor", "Penang", "Sabah", "Sarawak",
-            "Jakarta", "West Java", "Bangkok", "Ontario", "Quebec"
-        }
+    def _load_states(self) -> frozenset:
+        return _GPE_STATES
     
     def pseudonymize(self, original_text: str, entity_label: str) -> str:
         text = original_text.strip()
-        
-        if text in self.countries:
-            category = "COUNTRY"
-            prefix = "Country"
-        elif text in self.states:
-            category = "STATE"
-            prefix = "State"
-        else:
-            category = "CITY"
-            prefix = "City"
+        category, prefix = self.categories.get(text, ("CITY", "City"))
         
         if self.use_hash:
-            hash_input = f"{self.salt}:{category}:{text}".encode('utf-8')
-            hash_object = hashlib.sha256(hash_input)
-            letter_index = int(hash_object.hexdigest()[:2], 16) % 26
-            letter = chr(ord("A") + letter_index)
+            letter = _hash_letter(f"{self.salt}:{category}:{text}")
         else:
             self.counters[category] += 1
             letter = chr(ord("A") + (self.counters[category] - 1) % 26)
@@ -1538,27 +1752,76 @@ class GPEPseudonymizer(EntityPseudonymizer):
 # MAIN PIPELINE
 # ============================================================================
 
+# English models from fastest to most accurate
+SPACY_FALLBACK_MODELS = ("en_core_web_sm", "en_core_web_md", "en_core_web_lg", "en_core_web_trf")
+
+
+def spacy_models_to_try(model_name: str) -> List[str]:
+    """The requested model, then the other English models nearest to it in speed and accuracy"""
+    if model_name not in SPACY_FALLBACK_MODELS:
+        return [model_name] + list(reversed(SPACY_FALLBACK_MODELS))
+    
+    requested = SPACY_FALLBACK_MODELS.index(model_name)
+    # Equally near models: the faster one first
+    return sorted(SPACY_FALLBACK_MODELS,
+                  key=lambda model: (abs(SPACY_FALLBACK_MODELS.index(model) - requested),
+                                     SPACY_FALLBACK_MODELS.index(model)))
+
+
+def _is_installed_package(model: str) -> bool:
+    try:
+        return find_spec(model) is not None
+    except (ImportError, ValueError):
+        # Not an importable package name, e.g. a path to a model directory
+        return False
+
+
+def resolve_spacy_model(model_name: str) -> str:
+    """Name of the model load_spacy_model will load: the first installed one to try"""
+    return next((model for model in spacy_models_to_try(model_name) if _is_installed_package(model)),
+                model_name)
+
+
+def load_spacy_model(model_name: str, disable: Tuple[str, ...] = ()):
+    """Load the requested spaCy model, falling back to the nearest other English model"""
+    # Imported here so the regex-only extractors don't pay for spaCy/torch at import time
+    import spacy
+    
+    for model in spacy_models_to_try(model_name):
+        try:
+            return spacy.load(model, disable=list(disable))
+        except OSError:
+            logging.warning(f"Could not load spaCy model: {model}")
+            continue
+    
+    raise RuntimeError("No spaCy model found. Please install: python -m spacy download en_core_web_sm")
+
+
+# Lower wins when entities of different types overlap; unknown labels rank last
+LABEL_PRIORITY = {
+    "LEGAL_PERSON": 1,
+    "PERSON": 2,
+    "ORG": 3,
+    "GPE": 4,
+    "FAC": 5,
+    "ADDRESS": 6,
+    "MONEY": 7,
+    "NUMBER": 8,
+    "DATE": 9
+}
+
+
 class PseudonymizationPipeline:
     """Main pipeline that coordinates all extractors and pseudonymizers"""
     
-    def __init__(self, config: Optional[PseudonymConfig] = None):
+    def __init__(self, config: Optional[PseudonymConfig] = None, nlp=None):
         self.config = config or PseudonymConfig()
-        self.nlp = self._load_spacy_model()
+        self.nlp = nlp if nlp is not None else self._load_spacy_model()
         
         self.extractors = self._initialize_extractors()
-        self.pseudonymizers = self._initialize_pseudonymizers()
     
     def _load_spacy_model(self):
-        models_to_try = [self.config.model_name, "en_core_web_md", "en_core_web_sm"]
-        
-        for model in models_to_try:
-            try:
-                return spacy.load(model)
-            except OSError:
-                logging.warning(f"Could not load spaCy model: {model}")
-                continue
-        
-        raise RuntimeError("No spaCy model found. Please install: python -m spacy download en_core_web_sm")
+        return load_spacy_model(self.config.model_name, self.config.spacy_disable)
     
     def _initialize_extractors(self) -> List[EntityExtractor]:
         extractors = []
@@ -1582,7 +1845,11 @@ class PseudonymizationPipeline:
             extractors.append(AddressExtractor())
         
         if self.config.enable_spacy_extraction:
-            extractors.append(SpacyExtractor(self.nlp, {"PERSON", "GPE", "FAC", "ORG"}))
+            extractors.append(SpacyExtractor(
+                self.nlp, {"PERSON", "GPE", "FAC", "ORG"},
+                batch_size=self.config.spacy_batch_size,
+                max_chunk_chars=self.config.spacy_max_chunk_chars
+            ))
         
         return extractors
     
@@ -1603,50 +1870,52 @@ class PseudonymizationPipeline:
         if not text or not text.strip():
             return text, {}
         
+        # Pseudonymizers keep per-document state (caches, counters, date shifts),
+        # so every document gets a fresh set and one pipeline can be reused
+        pseudonymizers = self._initialize_pseudonymizers()
+        
         all_entities = self._extract_all_entities(text)
         all_entities = self._remove_overlaps(all_entities)
-        self._prepare_pseudonymizers(all_entities)
+        self._prepare_pseudonymizers(all_entities, pseudonymizers)
         
-        return self._apply_pseudonymization(text, all_entities)
+        return self._apply_pseudonymization(text, all_entities, pseudonymizers)
     
     def _extract_all_entities(self, text: str) -> List[Entity]:
         all_entities = []
         
-        for extractor in self.extractors:
-            try:
-                entities = extractor.extract(text)
+        # Extractors only read the text, so they run side by side. The regex extractors hold
+        # the GIL, but spaCy's model inference releases it and overlaps with them
+        with ThreadPoolExecutor(max_workers=max(1, len(self.extractors))) as executor:
+            results = executor.map(lambda extractor: self._run_extractor(extractor, text), self.extractors)
+            
+            # map() yields in extractor order, which keeps overlap resolution deterministic
+            for entities in results:
                 all_entities.extend(entities)
-                logging.debug(f"{extractor.__class__.__name__} found {len(entities)} entities")
-            except Exception as e:
-                logging.error(f"Error in {extractor.__class__.__name__}: {e}")
         
         return all_entities
     
+    def _run_extractor(self, extractor: EntityExtractor, text: str) -> List[Entity]:
+        try:
+            entities = extractor.extract(text)
+            logging.debug("%s found %d entities", extractor.__class__.__name__, len(entities))
+            return entities
+        except Exception as e:
+            logging.error(f"Error in {extractor.__class__.__name__}: {e}")
+            return []
+    
     def _remove_overlaps(self, entities: List[Entity]) -> List[Entity]:
         if not entities:
             return entities
 
-        priority_order = {
-            "LEGAL_PERSON": 1,
-            "PERSON": 2, 
-            "ORG": 3, 
-            "GPE": 4, 
-            "FAC": 5, 
-            "ADDRESS": 6, 
-            "MONEY": 7, 
-            "NUMBER": 8, 
-            "DATE": 9
-        }
-        
-        sorted_entities = sorted(entities, key=lambda e: e.start)
+        sorted_entities = sorted(entities, key=attrgetter("start"))
         result = []
         
         for entity in sorted_entities:
             overlaps = False
             for i, accepted in enumerate(result):
                 if entity.start < accepted.end and entity.end > accepted.start:
-                    entity_priority = priority_order.get(entity.label, 10)
-                    accepted_priority = priority_order.get(accepted.label, 10)
+                    entity_priority = LABEL_PRIORITY.get(entity.label, 10)
+                    accepted_priority = LABEL_PRIORITY.get(accepted.label, 10)
                     
                     if entity_priority < accepted_priority:
                         result[i] = entity
@@ -1661,20 +1930,20 @@ class PseudonymizationPipeline:
         
         return result
     
-    def _prepare_pseudonymizers(self, all_entities: List[Entity]) -> None:
-        for label, pseudonymizer in self.pseudonymizers.items():
+    def _prepare_pseudonymizers(self, all_entities: List[Entity], pseudonymizers: Dict[str, EntityPseudonymizer]) -> None:
+        for label, pseudonymizer in pseudonymizers.items():
             relevant_entities = [e for e in all_entities if e.label == label]
             if relevant_entities:
                 pseudonymizer.prepare(relevant_entities)
     
-    def _apply_pseudonymization(self, text: str, entities: List[Entity]) -> Tuple[str, Dict[str, str]]:
+    def _apply_pseudonymization(self, text: str, entities: List[Entity], pseudonymizers: Dict[str, EntityPseudonymizer]) -> Tuple[str, Dict[str, str]]:
         replacement_mapping = {}
         result_text = text
         
         temp_mapping = {}
         for entity in entities:
-            if entity.label in self.pseudonymizers:
-                pseudonymizer = self.pseudonymizers[entity.label]
+            if entity.label in pseudonymizers:
+                pseudonymizer = pseudonymizers[entity.label]
                 
                 if isinstance(entity, PersonEntity):
                     pseudonymizer._current_entity = entity
@@ -1690,8 +1959,8 @@ class PseudonymizationPipeline:
                     temp_mapping[entity.text] = pseudonymizer.get_replacement(entity.text, entity.label)
         
         for entity in entities:
-            if entity.label in self.pseudonymizers:
-                pseudonymizer = self.pseudonymizers[entity.label]
+            if entity.label in pseudonymizers:
+                pseudonymizer = pseudonymizers[entity.label]
                 
                 if entity.label == "LEGAL_PERSON":
                     base_pseudo = temp_mapping.get(entity.text, entity.text)
@@ -1712,7 +1981,7 @@ class PseudonymizationPipeline:
         return result_text, replacement_mapping
 
     def _extract_bare_name_from_entity(self, entity: Entity) -> str:
-        match = re.match(r'^([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*?)(?:,|\s+\()', entity.text)
+        match = _BARE_NAME_PATTERN.match(entity.text)
         if match:
             return match.group(1).strip()
         return entity.text
@@ -0,0 +1,101 @@
+"""Tests for DocumentProcessor text extraction."""
+import unittest
+from io import BytesIO
+
+from docx import Document
+from docx.enum.text import WD_BREAK
+from docx.oxml import parse_xml
+
+from pseudonymizer_app import DocumentProcessor
+
+W = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+
+# A run holding a DrawingML text box with its VML fallback, as Word saves it
+TEXT_BOX_RUN = f"""
+<w:r xmlns:w="{W}"
+     xmlns:mc="http://schemas.openxmlformats.org/markup-compatibility/2006"
+     xmlns:wps="http://schemas.microsoft.com/office/word/2010/wordprocessingShape"
+     xmlns:v="urn:schemas-microsoft-com:vml">
+  <mc:AlternateContent>
+    <mc:Choice Requires="wps">
+      <w:drawing>
+        <wps:wsp>
+          <wps:txbx>
+            <w:txbxContent><w:p><w:r><w:t>Box text</w:t></w:r></w:p></w:txbxContent>
+          </wps:txbx>
+        </wps:wsp>
+      </w:drawing>
+    </mc:Choice>
+    <mc:Fallback>
+      <w:pict>
+        <v:shape>
+          <v:textbox>
+            <w:txbxContent><w:p><w:r><w:t>Box text</w:t></w:r></w:p></w:txbxContent>
+          </v:textbox>
+        </v:shape>
+      </w:pict>
+    </mc:Fallback>
+  </mc:AlternateContent>
+</w:r>
+"""
+
+
+class FakeUpload(BytesIO):
+    """Stands in for a Streamlit UploadedFile"""
+    def __init__(self, data: bytes, name: str):
+        super().__init__(data)
+        self.name = name
+
+
+def docx_upload(document) -> FakeUpload:
+    buffer = BytesIO()
+    document.save(buffer)
+    return FakeUpload(buffer.getvalue(), "test.docx")
+
+
+class ExtractTextFromDocxTest(unittest.TestCase):
+
+    def test_paragraphs_and_table_cells_in_document_order(self):
+        document = Document()
+        document.add_paragraph("First")
+        document.add_table(rows=1, cols=2).rows[0].cells[0].text = "Cell"
+        document.add_paragraph("Last")
+
+        text = DocumentProcessor.extract_text_from_docx(docx_upload(document))
+
+        self.assertEqual(text.split("\n"), ["First", "Cell", "", "Last"])
+
+    def test_text_box_is_extracted_once_on_its_own_line(self):
+        document = Document()
+        paragraph = document.add_paragraph("Body para")
+        paragraph._p.append(parse_xml(TEXT_BOX_RUN))
+
+        text = DocumentProcessor.extract_text_from_docx(docx_upload(document))
+
+        self.assertEqual(text, "Body para\nBox text")
+
+    def test_only_line_breaks_become_newlines(self):
+        document = Document()
+        paragraph = document.add_paragraph()
+        run = paragraph.add_run("Line\tone")
+        run.add_break()
+        run.add_text("Line two")
+        run.add_break(WD_BREAK.PAGE)
+        run.add_text("Next page")
+
+        text = DocumentProcessor.extract_text_from_docx(docx_upload(document))
+
+        self.assertEqual(text, paragraph.text)
+        self.assertEqual(text, "Line\tone\nLine twoNext page")
+
+    def test_curly_quotes_are_normalized(self):
+        document = Document()
+        document.add_paragraph("“Plaintiff” and ‘Defendant’")
+
+        text = DocumentProcessor.extract_text_from_docx(docx_upload(document))
+
+        self.assertEqual(text, "\"Plaintiff\" and 'Defendant'")
+
+
+if __name__ == "__main__":
+    unittest.main()
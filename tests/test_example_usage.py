@@ -0,0 +1,30 @@
+"""Tests for the consistency helpers in example_usage."""
+import unittest
+
+from example_usage import check_consistency, group_by_name
+
+
+class GroupByNameTest(unittest.TestCase):
+
+    def test_name_contained_in_another_name_is_still_grouped(self):
+        mapping = {"Anna Lee": "Plaintiff A", "Lee": "Person B"}
+
+        buckets = group_by_name(mapping, {"Anna Lee": "Anna Lee", "Lee": "Lee"})
+
+        is_consistent, replacements, items = check_consistency(buckets.get("Lee"))
+        self.assertFalse(is_consistent)
+        self.assertEqual(replacements, {"Plaintiff A", "Person B"})
+        self.assertEqual(items, [("Anna Lee", "Plaintiff A"), ("Lee", "Person B")])
+
+        is_consistent, replacements, _ = check_consistency(buckets.get("Anna Lee"))
+        self.assertTrue(is_consistent)
+        self.assertEqual(replacements, {"Plaintiff A"})
+
+    def test_name_without_matches_has_no_bucket(self):
+        buckets = group_by_name({"Anna Lee": "Plaintiff A"}, ["Carlos Rivera"])
+
+        self.assertIsNone(check_consistency(buckets.get("Carlos Rivera")))
+
+
+if __name__ == "__main__":
+    unittest.main()
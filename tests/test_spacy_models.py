@@ -0,0 +1,38 @@
+"""Tests for spaCy model fallback ordering."""
+import unittest
+from unittest import mock
+
+import pseudonymscript
+from pseudonymscript import resolve_spacy_model, spacy_models_to_try
+
+
+class SpacyModelFallbackTest(unittest.TestCase):
+
+    def test_fast_tier_falls_back_to_the_next_fastest_model(self):
+        self.assertEqual(
+            spacy_models_to_try("en_core_web_sm"),
+            ["en_core_web_sm", "en_core_web_md", "en_core_web_lg", "en_core_web_trf"]
+        )
+
+    def test_equally_near_models_prefer_the_faster_one(self):
+        self.assertEqual(
+            spacy_models_to_try("en_core_web_lg"),
+            ["en_core_web_lg", "en_core_web_md", "en_core_web_trf", "en_core_web_sm"]
+        )
+
+    def test_unknown_model_is_tried_first(self):
+        self.assertEqual(spacy_models_to_try("custom_model")[0], "custom_model")
+
+    def test_resolves_to_the_nearest_installed_model(self):
+        installed = {"en_core_web_md", "en_core_web_trf"}
+        with mock.patch.object(pseudonymscript, "_is_installed_package", side_effect=installed.__contains__):
+            self.assertEqual(resolve_spacy_model("en_core_web_sm"), "en_core_web_md")
+            self.assertEqual(resolve_spacy_model("en_core_web_trf"), "en_core_web_trf")
+
+    def test_resolves_to_the_requested_name_when_nothing_is_installed(self):
+        with mock.patch.object(pseudonymscript, "_is_installed_package", return_value=False):
+            self.assertEqual(resolve_spacy_model("en_core_web_sm"), "en_core_web_sm")
+
+
+if __name__ == "__main__":
+    unittest.main()